@@ -1,5 +1,5 @@
 from model import Automate
-from typing import Dict, Set
+from typing import Dict, List, Set
 
 class AnalyseAutomate:
     """
@@ -47,25 +47,43 @@ class AnalyseAutomate:
         Vérifie si un automate est complet :
         Pour chaque état q et chaque symbole a de l'alphabet,
         il existe au moins une transition (q, a, p).
+        Un automate muni d'un puits implicite est complet par définition.
         """
-        for etat in automate.listEtats:
-            for symbole in automate.listAlphabets:
-                found = False
-                for t in automate.listTransition:
-                    if t.etatSource.idEtat == etat.idEtat and t.alphabet.valAlphabet == symbole.valAlphabet:
-                        found = True
-                        break
-                if not found:
-                    return False
-        return True
+        if automate.puitsImplicite:
+            return True
+        presents = {(t.etatSource.idEtat, t.alphabet.valAlphabet) for t in automate.listTransition}
+        return all((etat.idEtat, symbole.valAlphabet) in presents
+                   for etat in automate.listEtats for symbole in automate.listAlphabets)
 
     @staticmethod
-    def completer(automate: Automate) -> Automate:
+    def completer(automate: Automate, implicite: bool = False, en_place: bool = True) -> Automate:
         """
         Complète l'automate en ajoutant un état puits et toutes les transitions manquantes
         pour chaque couple (état, symbole) de l'alphabet. L'état puits s'auto-boucle sur chaque symbole.
-        Retourne l'automate complété (modifie en place).
+        Si implicite=True, aucun état ni transition n'est créé : l'automate est seulement marqué
+        comme ayant un puits virtuel (les entrées absentes de sa table compilée y mènent) ;
+        materialiser_puits le rend explicite à la demande.
+        Retourne l'automate complété (modifie en place, sauf si en_place=False : une nouvelle
+        version est alors créée par copie sur écriture, voir Automate.copie).
+        """
+        if not en_place:
+            automate = automate.copie()
+        if implicite:
+            automate.puitsImplicite = True
+            return automate
+        return AnalyseAutomate.materialiser_puits(automate)
+
+    @staticmethod
+    def materialiser_puits(automate: Automate, en_place: bool = True) -> Automate:
+        """
+        Ajoute explicitement l'état puits et les transitions manquantes (voir completer).
+        Les couples (état, symbole) déjà couverts sont indexés en une seule passe sur les
+        transitions : O(|T| + |Q|·|Σ|) au lieu d'un parcours des transitions par couple.
+        Retourne l'automate complété (modifie en place, sauf si en_place=False).
         """
+        from model import Etat, Transition
+        if not en_place:
+            automate = automate.copie()
         # Générer un nom unique pour l'état puits
         noms_etats = {e.idEtat for e in automate.listEtats}
         nom_puits = "PUITS"
@@ -73,40 +91,107 @@ class AnalyseAutomate:
         while nom_puits in noms_etats:
             nom_puits = f"PUITS{i}"
             i += 1
+        presents = {(t.etatSource.idEtat, t.alphabet.valAlphabet) for t in automate.listTransition}
         # Créer l'état puits
-        from model import Etat, Transition
         etat_puits = Etat(nom_puits, "Etat puits", "normal")
         automate.ajouter_etat(etat_puits)
         # Pour chaque état et chaque symbole, ajouter la transition manquante vers le puits
+        # (le puits lui-même reçoit ainsi ses boucles sur chaque symbole)
         for etat in automate.listEtats:
             for symbole in automate.listAlphabets:
-                existe = False
-                for t in automate.listTransition:
-                    if t.etatSource.idEtat == etat.idEtat and t.alphabet.valAlphabet == symbole.valAlphabet:
-                        existe = True
-                        break
-                if not existe:
-                    automate.ajouter_transition(Transition(
+                if (etat.idEtat, symbole.valAlphabet) not in presents:
+                    automate.listTransition.append(Transition(
                         f"trans_{len(automate.listTransition)}",
                         etat,
                         etat_puits,
                         symbole
                     ))
-        # Boucler l'état puits sur lui-même pour chaque symbole
-        for symbole in automate.listAlphabets:
-            automate.ajouter_transition(Transition(
-                f"trans_{len(automate.listTransition)}",
-                etat_puits,
-                etat_puits,
-                symbole
-            ))
+        automate.puitsImplicite = False
         return automate
 
     @staticmethod
-    def determiniser(afn: Automate) -> Automate:
+    def _parcourir(departs: Set[str], adjacence: Dict[str, List[str]]) -> Set[str]:
+        """Renvoie les identifiants d'états atteignables depuis departs en suivant adjacence."""
+        vus = set(departs)
+        pile = list(departs)
+        while pile:
+            courant = pile.pop()
+            for voisin in adjacence.get(courant, ()):
+                if voisin not in vus:
+                    vus.add(voisin)
+                    pile.append(voisin)
+        return vus
+
+    @staticmethod
+    def emonder(automate: Automate) -> Dict[str, int]:
+        """
+        Émonde l'automate : supprime les états inaccessibles (depuis un état initial) et
+        non co-accessibles (ne menant à aucun état final), ainsi que leurs transitions.
+        Deux parcours sur les listes d'adjacence avant et arrière : O(|Q| + |T|).
+        Un automate reconnaissant le langage vide garde un seul état initial, non final et sans
+        transition : il continue de rejeter tous les mots plutôt que de n'avoir aucun état initial.
+        Retourne un rapport {"etats_supprimes": n, "transitions_supprimees": m} (modifie en place).
+        """
+        successeurs: Dict[str, List[str]] = {}
+        predecesseurs: Dict[str, List[str]] = {}
+        for t in automate.listTransition:
+            src, dest = t.etatSource.idEtat, t.etatDestination.idEtat
+            successeurs.setdefault(src, []).append(dest)
+            predecesseurs.setdefault(dest, []).append(src)
+        accessibles = AnalyseAutomate._parcourir({e.idEtat for e in automate.listInitiaux}, successeurs)
+        coaccessibles = AnalyseAutomate._parcourir({e.idEtat for e in automate.listFinaux}, predecesseurs)
+        utiles = accessibles & coaccessibles
+        conserves = set(utiles)
+        if automate.listInitiaux and not any(e.idEtat in utiles for e in automate.listInitiaux):
+            conserves.add(automate.listInitiaux[0].idEtat)
+
+        nb_etats, nb_transitions = len(automate.listEtats), len(automate.listTransition)
+        automate.listEtats = [e for e in automate.listEtats if e.idEtat in conserves]
+        automate.listInitiaux = [e for e in automate.listInitiaux if e.idEtat in conserves]
+        automate.listFinaux = [e for e in automate.listFinaux if e.idEtat in utiles]
+        automate._filtrer_transitions(lambda t: t.etatSource.idEtat in utiles and t.etatDestination.idEtat in utiles)
+        return {
+            "etats_supprimes": nb_etats - len(automate.listEtats),
+            "transitions_supprimees": nb_transitions - len(automate.listTransition),
+        }
+
+    @staticmethod
+    def partitionner_alphabet(automate: Automate) -> Automate:
+        """
+        Réécrit l'automate sur les classes d'équivalence de son alphabet (voir PartitionAlphabet).
+        Les classes obtenues sont disjointes : chaque transition étiquetée par un symbole ou une
+        classe de caractères est remplacée par une transition par classe couverte. completer,
+        determiniser et minimiser travaillent alors sur les classes plutôt que sur les caractères.
+        Retourne un nouvel automate (mêmes objets Etat).
+        """
+        from model import Transition
+        from symboles import PartitionAlphabet
+        partition = PartitionAlphabet(automate.listAlphabets)
+        resultat = Automate(automate.nom + "_classes", automate.est_compact())
+        symboles = [partition.symbole_classe(c, f"cls_{c}") for c in range(partition.nb_classes)]
+        for symbole in symboles:
+            resultat.ajouter_alphabet(symbole)
+        for etat in automate.listEtats:
+            resultat.ajouter_etat(etat)
+        resultat.listInitiaux = list(automate.listInitiaux)
+        resultat.listFinaux = list(automate.listFinaux)
+        classes_par_val = partition.classes_par_valeur()
+        for t in automate.listTransition:
+            for classe in classes_par_val.get(t.alphabet.valAlphabet, ()):
+                resultat.listTransition.append(Transition(
+                    f"trans_{len(resultat.listTransition)}",
+                    t.etatSource,
+                    t.etatDestination,
+                    symboles[classe]
+                ))
+        return resultat
+
+    @staticmethod
+    def determiniser(afn: Automate, emonder: bool = False) -> Automate:
         """
         Transforme un AFN en AFD équivalent par la méthode des sous-ensembles (construction de puissance).
         Prend explicitement en compte l'état ∅ (ensemble vide) comme état poubelle.
+        Si emonder=True, le résultat est émondé (l'état ∅ disparaît alors avec les autres états inutiles).
         Retourne un nouvel automate déterministe.
         """
         from model import Automate, Etat, Alphabet, Transition
@@ -194,6 +279,8 @@ class AnalyseAutomate:
                 dest,
                 t.alphabet
             ))
+        if emonder:
+            AnalyseAutomate.emonder(afd)
         return afd
 
     @staticmethod
@@ -204,16 +291,10 @@ class AnalyseAutomate:
         """
         from model import Automate, Etat, Alphabet, Transition
         # 1. Supprimer les états inaccessibles
-        accessibles = set()
-        file = [e for e in afd.listInitiaux]
-        while file:
-            courant = file.pop()
-            if courant.idEtat in accessibles:
-                continue
-            accessibles.add(courant.idEtat)
-            for t in afd.listTransition:
-                if t.etatSource.idEtat == courant.idEtat and t.etatDestination.idEtat not in accessibles:
-                    file.append(t.etatDestination)
+        successeurs: Dict[str, List[str]] = {}
+        for t in afd.listTransition:
+            successeurs.setdefault(t.etatSource.idEtat, []).append(t.etatDestination.idEtat)
+        accessibles = AnalyseAutomate._parcourir({e.idEtat for e in afd.listInitiaux}, successeurs)
         # 2. Partition initiale : finaux vs non-finaux
         finaux = {e.idEtat for e in afd.listFinaux if e.idEtat in accessibles}
         non_finaux = {e.idEtat for e in afd.listEtats if e.idEtat in accessibles and e.idEtat not in finaux}
@@ -1,12 +1,14 @@
 
 import os, json, re
 from model import Alphabet, Automate, Etat, Transition
+from journal import JournalAutomate
 from typing import List, Dict, Optional
 
 # --- Gestion des automates (Nouveau code) ---
 class GestionAutomates:
     def __init__(self):
         self.automates: Dict[str, Automate] = {}  # Dictionnaire pour stocker les automates en mémoire
+        self.journaux: Dict[str, JournalAutomate] = {}  # Journal des modifications de chaque automate
         self.dossier_automates = "Automates"
 
     def creer_automate(self) -> None:
@@ -19,6 +21,7 @@ class GestionAutomates:
             return
         
         automate = Automate(nom)
+        journal = JournalAutomate.creer(automate, self.dossier_automates)
         
         # Ajout des symboles à l'alphabet
         print("\nAjout des symboles à l'alphabet (tapez 'fin' pour terminer) :")
@@ -26,7 +29,7 @@ class GestionAutomates:
             symbole = input("Symbole (ex: 'a', '0') : ").strip()
             if symbole.lower() == 'fin':
                 break
-            automate.ajouter_alphabet(Alphabet(f"sym_{len(automate.listAlphabets)}", symbole))
+            journal.ajouter_alphabet(Alphabet(f"sym_{len(automate.listAlphabets)}", symbole))
         
         # Ajout des états
         print("\nAjout des états (tapez 'fin' pour terminer) :")
@@ -42,7 +45,7 @@ class GestionAutomates:
             if type_etat not in ["initial", "final", "normal"]:
                 print("Type d'état invalide. Veuillez choisir parmi 'initial', 'final' ou 'normal'.")
                 continue
-            automate.ajouter_etat(Etat(id_etat, label, type_etat))
+            journal.ajouter_etat(Etat(id_etat, label, type_etat))
         
         # Ajout des transitions
         print("\nAjout des transitions (tapez 'fin' pour terminer) :")
@@ -64,7 +67,7 @@ class GestionAutomates:
                 etat_dest = next(e for e in automate.listEtats if e.idEtat == dest)
                 alphabet = next(a for a in automate.listAlphabets if a.valAlphabet == symbole)
                 
-                automate.ajouter_transition(Transition(
+                journal.ajouter_transition(Transition(
                     f"trans_{len(automate.listTransition)}",
                     etat_source,
                     etat_dest,
@@ -74,9 +77,9 @@ class GestionAutomates:
             except StopIteration:
                 print("Erreur : Etat ou symbole introuvable.")
         
-        # Sauvegarde et ajout à la collection
-        automate.sauvegarder_json(self.dossier_automates)
+        # Ajout à la collection (chaque ajout a déjà été journalisé)
         self.automates[nom] = automate
+        self.journaux[nom] = journal
         print(f"\nAutomate '{nom}' créé et sauvegardé avec succès !")
 
     def modifier_automate(self) -> None:
@@ -89,6 +92,7 @@ class GestionAutomates:
             return
         
         automate = self.automates[nom]
+        journal = self.journaux[nom]
         
         while True:
             print("\nQue voulez-vous modifier ?")
@@ -99,12 +103,14 @@ class GestionAutomates:
             print("5. Ajouter une transition")
             print("6. Supprimer une transition")
             print("7. Terminer les modifications")
+            print("8. Annuler la dernière modification")
+            print("9. Rétablir la dernière modification annulée")
             
-            choix = input("Votre choix (1-7) : ").strip()
+            choix = input("Votre choix (1-9) : ").strip()
             
             if choix == '1':
                 symbole = input("Nouveau symbole : ").strip()
-                automate.ajouter_alphabet(Alphabet(f"sym_{len(automate.listAlphabets)}", symbole))
+                journal.ajouter_alphabet(Alphabet(f"sym_{len(automate.listAlphabets)}", symbole))
                 print("Symbole ajouté !")
             
             elif choix == '2':
@@ -112,7 +118,7 @@ class GestionAutomates:
                 symbole = input("Symbole à supprimer : ").strip()
                 try:
                     alphabet = next(a for a in automate.listAlphabets if a.valAlphabet == symbole)
-                    automate.supprimer_alphabet(alphabet.idAlphabet)
+                    journal.supprimer_alphabet(alphabet.idAlphabet)
                     print("Symbole supprimé !")
                 except StopIteration:
                     print("Symbole introuvable.")
@@ -121,7 +127,7 @@ class GestionAutomates:
                 id_etat = input("ID du nouvel état : ").strip()
                 label = input("Label : ").strip()
                 type_etat = input("Type (initial/final/normal) : ").strip().lower()
-                automate.ajouter_etat(Etat(id_etat, label, type_etat))
+                journal.ajouter_etat(Etat(id_etat, label, type_etat))
                 print("Etat ajouté !")
             
             elif choix == '4':
@@ -138,11 +144,12 @@ class GestionAutomates:
                     if action == 'm':
                         new_label = input(f"Nouveau label (actuel: {etat.labelEtat}) : ").strip()
                         new_type = input(f"Nouveau type (actuel: {etat.typeEtat}) : ").strip().lower()
-                        etat.labelEtat = new_label if new_label else etat.labelEtat
-                        etat.typeEtat = new_type if new_type else etat.typeEtat
+                        journal.modifier_etat(id_etat,
+                                              new_label if new_label else etat.labelEtat,
+                                              new_type if new_type else etat.typeEtat)
                         print("Etat modifié !")
                     elif action == 's':
-                        automate.supprimer_etat(id_etat)
+                        journal.supprimer_etat(id_etat)
                         print("Etat supprimé !")
                 except StopIteration:
                     print("Etat introuvable.")
@@ -160,7 +167,7 @@ class GestionAutomates:
                     etat_dest = next(e for e in automate.listEtats if e.idEtat == dest)
                     alphabet = next(a for a in automate.listAlphabets if a.valAlphabet == symbole)
                     
-                    automate.ajouter_transition(Transition(
+                    journal.ajouter_transition(Transition(
                         f"trans_{len(automate.listTransition)}",
                         etat_source,
                         etat_dest,
@@ -178,7 +185,7 @@ class GestionAutomates:
                 try:
                     idx = int(input("Numéro de la transition à supprimer : ")) - 1
                     if 0 <= idx < len(automate.listTransition):
-                        automate.supprimer_transition(automate.listTransition[idx].idTransition)
+                        journal.supprimer_transition(automate.listTransition[idx].idTransition)
                         print("Transition supprimée !")
                     else:
                         print("Numéro invalide.")
@@ -186,10 +193,16 @@ class GestionAutomates:
                     print("Veuillez entrer un nombre.")
             
             elif choix == '7':
-                automate.sauvegarder_json(self.dossier_automates)
+                # Chaque modification est déjà dans le journal : rien à réécrire
                 print("Modifications sauvegardées !")
                 break
             
+            elif choix == '8':
+                print("Modification annulée !" if journal.annuler() else "Aucune modification à annuler.")
+            
+            elif choix == '9':
+                print("Modification rétablie !" if journal.retablir() else "Aucune modification à rétablir.")
+            
             else:
                 print("Choix invalide.")
 
@@ -202,13 +215,12 @@ class GestionAutomates:
             print(f"Erreur : Automate '{nom}' introuvable.")
             return
         
-        # Suppression du fichier
-        chemin = f"{self.dossier_automates}/{nom}.json"
-        if os.path.exists(chemin):
-            os.remove(chemin)
+        # Suppression de l'instantané et du journal
+        self.journaux[nom].supprimer()
         
         # Suppression de la mémoire
         del self.automates[nom]
+        del self.journaux[nom]
         print(f"Automate '{nom}' supprimé avec succès !")
 
     def charger_automates_existants(self) -> None:
@@ -221,8 +233,9 @@ class GestionAutomates:
             if fichier.endswith(".json"):
                 nom = fichier[:-5]  # Retire l'extension .json
                 try:
-                    automate = Automate.charger_json(nom, self.dossier_automates)
-                    self.automates[nom] = automate
+                    journal = JournalAutomate.charger(nom, self.dossier_automates)
+                    self.automates[nom] = journal.automate
+                    self.journaux[nom] = journal
                 except Exception as e:
                     print(f"Erreur lors du chargement de {nom} : {str(e)}")
 
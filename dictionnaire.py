@@ -0,0 +1,118 @@
+from model import Automate, Etat, Alphabet, Transition
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+
+class _Noeud:
+    """Etat en cours de construction, sur le chemin du dernier mot ajouté."""
+    __slots__ = ("final", "aretes")
+
+    def __init__(self):
+        self.final = False
+        # symbole -> indice d'un état déjà émis, ou _Noeud pour le dernier fils (non enregistré)
+        self.aretes: Dict[str, Union[int, '_Noeud']] = {}
+
+
+class ConstructeurDictionnaire:
+    """
+    Construction incrémentale d'un automate acyclique minimal à partir de mots triés
+    (algorithme de Daciuk–Mihov).
+
+    Seul le chemin du dernier mot ajouté est gardé sous forme de nœuds provisoires.
+    Dès qu'un suffixe ne peut plus être prolongé, ses états sont comparés au registre
+    des états déjà émis : un état équivalent (même finalité, mêmes transitions) est
+    réutilisé, sinon l'état est émis directement dans l'automate résultat. La mémoire
+    reste ainsi proportionnelle à l'automate minimal, en une seule passe sur les mots.
+    """
+
+    def __init__(self, nom: str = "dictionnaire", compact: bool = False):
+        self.automate = Automate(nom, compact)
+        self._registre: Dict[Tuple[bool, Tuple[Tuple[str, int], ...]], int] = {}
+        self._symboles: Dict[str, Alphabet] = {}
+        self._chemin: List[_Noeud] = [_Noeud()]
+        self._precedent: Optional[str] = None
+        self._termine = False
+
+    def _symbole(self, valeur: str) -> Alphabet:
+        symbole = self._symboles.get(valeur)
+        if symbole is None:
+            symbole = Alphabet(f"sym_{len(self.automate.listAlphabets)}", valeur)
+            self.automate.listAlphabets.append(symbole)
+            self._symboles[valeur] = symbole
+        return symbole
+
+    def _emettre(self, noeud: _Noeud, initial: bool = False) -> int:
+        """Crée l'état correspondant au nœud et ses transitions vers des états déjà émis."""
+        # Ajouts directs aux listes : les identifiants sont uniques par construction
+        indice = len(self.automate.listEtats)
+        type_etat = "initial" if initial else ("final" if noeud.final else "normal")
+        etat = Etat(f"q{indice}", f"q{indice}", type_etat)
+        self.automate.listEtats.append(etat)
+        if initial:
+            self.automate.listInitiaux.append(etat)
+        if noeud.final:
+            self.automate.listFinaux.append(etat)
+        for valeur, enfant in noeud.aretes.items():
+            self.automate.listTransition.append(Transition(
+                f"trans_{len(self.automate.listTransition)}",
+                etat,
+                self.automate.listEtats[enfant],
+                self._symbole(valeur)
+            ))
+        return indice
+
+    def _enregistrer(self, noeud: _Noeud) -> int:
+        """Renvoie l'indice d'un état équivalent déjà émis, ou émet le nœud."""
+        signature = (noeud.final, tuple(noeud.aretes.items()))
+        indice = self._registre.get(signature)
+        if indice is None:
+            indice = self._emettre(noeud)
+            self._registre[signature] = indice
+        return indice
+
+    def _figer_suffixe(self, longueur: int) -> None:
+        """Enregistre les nœuds du chemin au-delà des longueur premiers symboles du mot précédent."""
+        for i in range(len(self._chemin) - 1, longueur, -1):
+            self._chemin[i - 1].aretes[self._precedent[i - 1]] = self._enregistrer(self._chemin[i])
+        del self._chemin[longueur + 1:]
+
+    def ajouter_mot(self, mot: str) -> None:
+        """Ajoute un mot, qui doit être supérieur ou égal au précédent dans l'ordre lexicographique."""
+        if self._termine:
+            raise ValueError("La construction est déjà terminée.")
+        if self._precedent is not None:
+            if mot < self._precedent:
+                raise ValueError(f"Les mots doivent être triés : '{mot}' après '{self._precedent}'.")
+            if mot == self._precedent:
+                return
+            commun = 0
+            limite = min(len(mot), len(self._precedent))
+            while commun < limite and mot[commun] == self._precedent[commun]:
+                commun += 1
+            self._figer_suffixe(commun)
+        else:
+            commun = 0
+        for valeur in mot[commun:]:
+            noeud = _Noeud()
+            self._chemin[-1].aretes[valeur] = noeud
+            self._chemin.append(noeud)
+        self._chemin[-1].final = True
+        self._precedent = mot
+
+    def terminer(self) -> Automate:
+        """Enregistre le dernier chemin, émet l'état initial et renvoie l'automate minimal."""
+        if not self._termine:
+            if self._precedent is not None:
+                self._figer_suffixe(0)
+            # La racine n'est équivalente à aucun autre état d'un automate acyclique
+            self._emettre(self._chemin[0], initial=True)
+            self._registre.clear()
+            self._termine = True
+        return self.automate
+
+
+def construire_automate_mots(mots: Iterable[str], nom: str = "dictionnaire", compact: bool = False) -> Automate:
+    """Construit l'automate acyclique minimal reconnaissant exactement les mots (triés) fournis."""
+    constructeur = ConstructeurDictionnaire(nom, compact)
+    for mot in mots:
+        constructeur.ajouter_mot(mot)
+    return constructeur.terminer()
@@ -0,0 +1,248 @@
+import json, os
+from model import Alphabet, Automate, Etat, Transition, alphabet_depuis_json, alphabet_vers_json
+from typing import Dict, List, Tuple
+
+
+class JournalAutomate:
+    """
+    Journal append-only des modifications d'un automate.
+
+    L'automate est persisté sous forme d'un instantané JSON (Automate.sauvegarder_json)
+    et d'un journal "<nom>.journal" où chaque opération (ajout/suppression d'état, de
+    symbole ou de transition, modification d'état) est une ligne JSON numérotée : une
+    modification coûte une écriture de taille constante. Au chargement, les
+    enregistrements postérieurs à l'instantané (sequence_journal) sont rejoués.
+    Quand le journal devient aussi gros que l'automate, il est compacté dans un
+    nouvel instantané, ce qui garde un coût amorti constant par modification.
+
+    Chaque opération mémorise ses opérations inverses, ce qui permet d'annuler et de
+    rétablir les modifications de la session en O(taille de la modification) ; une
+    annulation est elle-même journalisée comme une opération ordinaire.
+    """
+
+    SEUIL_COMPACTAGE = 1000  # nombre minimal d'enregistrements avant compactage
+
+    def __init__(self, automate: Automate, dossier: str = "Automates"):
+        self.automate = automate
+        self.dossier = dossier
+        self.chemin = f"{dossier}/{automate.nom}.journal"
+        self.nb_enregistrements = 0
+        self._fichier = None
+        # Index par id, maintenus par les opérations du journal
+        self._etats: Dict[str, Etat] = {e.idEtat: e for e in automate.listEtats}
+        self._symboles: Dict[str, Alphabet] = {a.idAlphabet: a for a in automate.listAlphabets}
+        # Piles d'annulation : (opérations inverses, opération d'origine)
+        self._annulations: List[Tuple[List[Dict], Dict]] = []
+        self._retablissements: List[Tuple[List[Dict], Dict]] = []
+
+    @classmethod
+    def creer(cls, automate: Automate, dossier: str = "Automates") -> 'JournalAutomate':
+        """Ecrit l'instantané initial d'un nouvel automate et ouvre un journal vide."""
+        journal = cls(automate, dossier)
+        journal.compacter()
+        return journal
+
+    @classmethod
+    def charger(cls, nom: str, dossier: str = "Automates") -> 'JournalAutomate':
+        """
+        Charge l'instantané puis rejoue les enregistrements du journal qui le suivent.
+        Un enregistrement n'est valide qu'une fois son saut de ligne écrit : une fin de
+        fichier tronquée par une interruption d'écriture est ignorée et retirée du
+        fichier, pour que le prochain enregistrement ne s'y colle pas.
+        """
+        journal = cls(Automate.charger_json(nom, dossier), dossier)
+        if os.path.exists(journal.chemin):
+            with open(journal.chemin, 'rb') as f:
+                contenu = f.read()
+            fin = contenu.rfind(b"\n") + 1
+            if fin < len(contenu):
+                with open(journal.chemin, 'r+b') as f:
+                    f.truncate(fin)
+            for ligne in contenu[:fin].decode('utf-8').splitlines():
+                operation = json.loads(ligne)
+                journal.nb_enregistrements += 1
+                if operation["seq"] <= journal.automate.sequenceJournal:
+                    continue  # déjà intégré à l'instantané
+                journal._appliquer(operation)
+                journal.automate.sequenceJournal = operation["seq"]
+            if journal._doit_compacter():
+                journal.compacter()
+        return journal
+
+    # --- Opérations journalisées ---
+    def ajouter_alphabet(self, alphabet: Alphabet) -> None:
+        self._executer(dict(alphabet_vers_json(alphabet), op="ajouter_alphabet"))
+
+    def supprimer_alphabet(self, idAlphabet: str) -> None:
+        self._executer({"op": "supprimer_alphabet", "id": idAlphabet})
+
+    def ajouter_etat(self, etat: Etat) -> None:
+        self._executer({"op": "ajouter_etat", "id": etat.idEtat, "label": etat.labelEtat, "type": etat.typeEtat})
+
+    def modifier_etat(self, idEtat: str, label: str, typeEtat: str) -> None:
+        self._executer({"op": "modifier_etat", "id": idEtat, "label": label, "type": typeEtat})
+
+    def supprimer_etat(self, idEtat: str) -> None:
+        self._executer({"op": "supprimer_etat", "id": idEtat})
+
+    def ajouter_transition(self, transition: Transition) -> None:
+        self._executer(self._transition_vers_json(transition))
+
+    def supprimer_transition(self, idTransition: str) -> None:
+        self._executer({"op": "supprimer_transition", "id": idTransition})
+
+    # --- Annulation ---
+    def annuler(self) -> bool:
+        """Annule la dernière modification de la session ; renvoie False s'il n'y en a aucune."""
+        if not self._annulations:
+            return False
+        inverses, operation = self._annulations.pop()
+        for inverse in inverses:
+            self._executer(inverse, historiser=False)
+        self._retablissements.append((inverses, operation))
+        return True
+
+    def retablir(self) -> bool:
+        """Rétablit la dernière modification annulée ; renvoie False s'il n'y en a aucune."""
+        if not self._retablissements:
+            return False
+        _, operation = self._retablissements.pop()
+        inverses = self._inverses(operation)
+        self._executer(dict(operation), historiser=False)
+        self._annulations.append((inverses, operation))
+        return True
+
+    def _transition_vers_json(self, transition: Transition) -> Dict:
+        return {
+            "op": "ajouter_transition",
+            "id": transition.idTransition,
+            "source": transition.etatSource.idEtat,
+            "dest": transition.etatDestination.idEtat,
+            "symbole": transition.alphabet.idAlphabet
+        }
+
+    def _inverses(self, operation: Dict) -> List[Dict]:
+        """
+        Opérations qui défont operation, calculées avant de l'appliquer. Une suppression
+        d'état ou de symbole emporte ses transitions, qui sont réajoutées après lui.
+        Renvoie une liste vide si l'élément visé n'existe pas (_appliquer lèvera l'erreur).
+        """
+        nature, ident = operation["op"], operation["id"]
+        if nature == "ajouter_alphabet":
+            return [{"op": "supprimer_alphabet", "id": ident}]
+        if nature == "ajouter_etat":
+            return [{"op": "supprimer_etat", "id": ident}]
+        if nature == "ajouter_transition":
+            return [{"op": "supprimer_transition", "id": ident}]
+        if nature == "modifier_etat":
+            etat = self._etats.get(ident)
+            if etat is None:
+                return []
+            return [{"op": "modifier_etat", "id": ident, "label": etat.labelEtat, "type": etat.typeEtat}]
+        if nature == "supprimer_alphabet":
+            alphabet = self._symboles.get(ident)
+            if alphabet is None:
+                return []
+            liees = [t for t in self.automate.listTransition if t.alphabet.idAlphabet == ident]
+            return [dict(alphabet_vers_json(alphabet), op="ajouter_alphabet")] + \
+                   [self._transition_vers_json(t) for t in liees]
+        if nature == "supprimer_etat":
+            etat = self._etats.get(ident)
+            if etat is None:
+                return []
+            liees = [t for t in self.automate.listTransition
+                     if t.etatSource.idEtat == ident or t.etatDestination.idEtat == ident]
+            return [{"op": "ajouter_etat", "id": ident, "label": etat.labelEtat, "type": etat.typeEtat}] + \
+                   [self._transition_vers_json(t) for t in liees]
+        if nature == "supprimer_transition":
+            transition = next((t for t in self.automate.listTransition if t.idTransition == ident), None)
+            return [] if transition is None else [self._transition_vers_json(transition)]
+        return []
+
+    # --- Mécanique du journal ---
+    def _executer(self, operation: Dict, historiser: bool = True) -> None:
+        """
+        Applique l'opération (qui peut lever ValueError) puis l'ajoute au journal.
+        Si historiser est vrai, ses inverses sont empilés pour annuler et l'historique
+        des rétablissements est vidé.
+        """
+        inverses = self._inverses(operation) if historiser else None
+        self._appliquer(operation)
+        if historiser:
+            self._annulations.append((inverses, dict(operation)))
+            self._retablissements.clear()
+        self.automate.sequenceJournal += 1
+        if self._fichier is None:
+            os.makedirs(self.dossier, exist_ok=True)
+            self._fichier = open(self.chemin, 'a', encoding='utf-8')
+        self._fichier.write(json.dumps(dict(operation, seq=self.automate.sequenceJournal),
+                                       ensure_ascii=False, separators=(",", ":")) + "\n")
+        self._fichier.flush()
+        self.nb_enregistrements += 1
+        if self._doit_compacter():
+            self.compacter()
+
+    def _appliquer(self, operation: Dict) -> None:
+        automate = self.automate
+        nature = operation["op"]
+        if nature == "ajouter_alphabet":
+            alphabet = alphabet_depuis_json(operation)
+            automate.ajouter_alphabet(alphabet)
+            self._symboles[alphabet.idAlphabet] = alphabet
+        elif nature == "supprimer_alphabet":
+            automate.supprimer_alphabet(operation["id"])
+            del self._symboles[operation["id"]]
+        elif nature == "ajouter_etat":
+            etat = Etat(operation["id"], operation["label"], operation["type"])
+            automate.ajouter_etat(etat)
+            self._etats[etat.idEtat] = etat
+        elif nature == "modifier_etat":
+            # Nouvel objet Etat : l'ancien peut être partagé avec une autre version (Automate.copie)
+            self._etats[operation["id"]] = automate.modifier_etat(operation["id"], operation["label"], operation["type"])
+        elif nature == "supprimer_etat":
+            automate.supprimer_etat(operation["id"])
+            del self._etats[operation["id"]]
+        elif nature == "ajouter_transition":
+            # Vérification par index : O(1) au lieu du parcours de ajouter_transition
+            for cle, index, nom in (("source", self._etats, "Etat source"),
+                                    ("dest", self._etats, "Etat destination"),
+                                    ("symbole", self._symboles, "Symbole")):
+                if operation[cle] not in index:
+                    raise ValueError(f"{nom} {operation[cle]} introuvable.")
+            automate.listTransition.append(Transition(
+                operation["id"],
+                self._etats[operation["source"]],
+                self._etats[operation["dest"]],
+                self._symboles[operation["symbole"]]
+            ))
+        elif nature == "supprimer_transition":
+            automate.supprimer_transition(operation["id"])
+        else:
+            raise ValueError(f"Opération de journal inconnue : {nature}.")
+
+    def _doit_compacter(self) -> bool:
+        taille = len(self.automate.listEtats) + len(self.automate.listTransition)
+        return self.nb_enregistrements >= max(self.SEUIL_COMPACTAGE, taille)
+
+    def compacter(self) -> None:
+        """
+        Ecrit un nouvel instantané (qui intègre tout le journal) puis vide le journal.
+        L'instantané remplace l'ancien de façon atomique (voir Automate.sauvegarder_json) :
+        une interruption laisse l'ancien instantané et le journal complet.
+        """
+        self.automate.sauvegarder_json(self.dossier)
+        self.fermer()
+        open(self.chemin, 'w', encoding='utf-8').close()
+        self.nb_enregistrements = 0
+
+    def fermer(self) -> None:
+        if self._fichier is not None:
+            self._fichier.close()
+            self._fichier = None
+
+    def supprimer(self) -> None:
+        """Supprime l'instantané et le journal de l'automate."""
+        self.fermer()
+        for chemin in (f"{self.dossier}/{self.automate.nom}.json", self.chemin):
+            if os.path.exists(chemin):
+                os.remove(chemin)
@@ -1,41 +1,76 @@
-from model import Automate, Etat, Alphabet, Transition
-from typing import List, Set
+from model import Automate, Etat, Alphabet, ClasseSymboles, Transition
+from moteur import AutomateCompile, AutomateBitParallele
+from Analyse import AnalyseAutomate
+from symboles import PartitionAlphabet
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple, Union
 from itertools import product
+from collections import deque
 
 
 def simuler_mot(automate: Automate, mot: str) -> bool:
-    """Simule un mot sur un automate (supposé déterministe)."""
+    """
+    Simule un mot sur un automate (supposé déterministe). Les transitions sont parcourues
+    une seule fois pour les indexer par état source, puis seules les transitions sortantes
+    de l'état courant sont examinées ; pour simuler de nombreux mots, compiler plutôt
+    l'automate une fois (AutomateCompile), comme generer_mots_acceptes.
+    """
     etat_courant = next((e for e in automate.listInitiaux), None)
     if not etat_courant:
         raise ValueError("Aucun état initial défini.")
+    if not mot:
+        return any(f.idEtat == etat_courant.idEtat for f in automate.listFinaux)
 
+    sortantes: Dict[str, List[Transition]] = {}
+    for t in automate.listTransition:
+        sortantes.setdefault(t.etatSource.idEtat, []).append(t)
     for symbole in mot:
-        transitions = [t for t in automate.listTransition
-                       if t.etatSource.idEtat == etat_courant.idEtat
-                       and t.alphabet.valAlphabet == symbole]
-        if not transitions:
+        # Première transition applicable, comme dans la table compilée ; sinon puits (éventuellement implicite)
+        transition = next((t for t in sortantes.get(etat_courant.idEtat, ())
+                           if t.alphabet.valAlphabet == symbole
+                           or (isinstance(t.alphabet, ClasseSymboles) and t.alphabet.contient(symbole))), None)
+        if transition is None:
             return False
-        etat_courant = transitions[0].etatDestination
+        etat_courant = transition.etatDestination
+
+    return any(f.idEtat == etat_courant.idEtat for f in automate.listFinaux)
+
 
-    return etat_courant in automate.listFinaux
+def simuler_mot_afn(automate: Union[Automate, AutomateBitParallele], mot: str) -> bool:
+    """
+    Simule un mot sur un automate quelconque (AFN) par simulation bit-parallèle, sans déterminisation.
+    Pour simuler de nombreux mots, passer un AutomateBitParallele compilé une fois plutôt que l'automate.
+    """
+    if isinstance(automate, AutomateBitParallele):
+        return automate.accepte(mot)
+    return AutomateBitParallele(automate).accepte(mot)
 
 
 def generer_mots_acceptes(automate: Automate, longueur_max: int) -> List[str]:
-    """Génère les mots acceptés jusqu'à une longueur donnée."""
-    symboles = [a.valAlphabet for a in automate.listAlphabets]
+    """Génère les mots acceptés jusqu'à une longueur donnée (un représentant par classe de symboles)."""
+    symboles = [a.representant() if isinstance(a, ClasseSymboles) else a.valAlphabet
+                for a in automate.listAlphabets]
+    table = AutomateCompile(automate)
     mots_acceptes = []
 
     for l in range(longueur_max + 1):
         for prod in product(symboles, repeat=l):
             mot = ''.join(prod)
-            if simuler_mot(automate, mot):
+            if table.accepte(mot):
                 mots_acceptes.append(mot)
 
     return mots_acceptes
 
 
-def union_automates(a1: Automate, a2: Automate) -> Automate:
-    """Construit l’union de deux automates déterministes (produit cartésien)."""
+def union_automates(a1: Automate, a2: Automate, emonder: bool = False) -> Automate:
+    """
+    Construit l’union de deux automates déterministes (produit cartésien), émondée si emonder=True.
+    Un puits implicite est d'abord matérialisé (sur une copie) : le produit doit pouvoir
+    continuer d'un côté quand l'autre est tombé dans le puits.
+    """
+    if a1.puitsImplicite:
+        a1 = AnalyseAutomate.materialiser_puits(a1, en_place=False)
+    if a2.puitsImplicite:
+        a2 = AnalyseAutomate.materialiser_puits(a2, en_place=False)
     new_auto = Automate(f"{a1.nom}_union_{a2.nom}")
     alphabet = a1.listAlphabets  # Supposés identiques
 
@@ -68,11 +103,13 @@ def union_automates(a1: Automate, a2: Automate) -> Automate:
                 symbole = next(a for a in new_auto.listAlphabets if a.valAlphabet == t1.alphabet.valAlphabet)
                 new_auto.ajouter_transition(Transition(f"{source_id}->{dest_id}_{symbole.idAlphabet}", source, dest, symbole))
 
+    if emonder:
+        AnalyseAutomate.emonder(new_auto)
     return new_auto
 
 
-def intersection_automates(a1: Automate, a2: Automate) -> Automate:
-    """Construit l’intersection de deux automates déterministes."""
+def intersection_automates(a1: Automate, a2: Automate, emonder: bool = False) -> Automate:
+    """Construit l’intersection de deux automates déterministes, émondée si emonder=True."""
     union = union_automates(a1, a2)
     # Redéfinir les états finaux uniquement si les deux composantes sont finales
     union.listFinaux = []
@@ -80,11 +117,14 @@ def intersection_automates(a1: Automate, a2: Automate) -> Automate:
         id1, id2 = e.idEtat.split("_")
         if any(f.idEtat == id1 for f in a1.listFinaux) and any(f.idEtat == id2 for f in a2.listFinaux):
             union.listFinaux.append(e)
+    # L'émondage se fait après redéfinition des finaux, sinon il garderait des états inutiles
+    if emonder:
+        AnalyseAutomate.emonder(union)
     return union
 
 
 def complement_automate(automate: Automate) -> Automate:
-    """Renvoie le complément d’un automate déterministe complet."""
+    """Renvoie le complément d’un automate déterministe complet (éventuellement via un puits implicite)."""
     comp = Automate(automate.nom + "_complement")
     for a in automate.listAlphabets:
         comp.ajouter_alphabet(Alphabet(a.idAlphabet, a.valAlphabet))
@@ -96,36 +136,302 @@ def complement_automate(automate: Automate) -> Automate:
         new_e = Etat(e.idEtat, e.labelEtat, new_type)
         comp.ajouter_etat(new_e)
 
-    comp.listFinaux = [e for e in comp.listEtats if all(f.idEtat != e.idEtat for f in automate.listFinaux)]
-
     for t in automate.listTransition:
         src = next(e for e in comp.listEtats if e.idEtat == t.etatSource.idEtat)
         dst = next(e for e in comp.listEtats if e.idEtat == t.etatDestination.idEtat)
         alpha = next(a for a in comp.listAlphabets if a.idAlphabet == t.alphabet.idAlphabet)
         comp.ajouter_transition(Transition(t.idTransition, src, dst, alpha))
 
+    # Un puits implicite doit devenir un vrai état pour être final dans le complément
+    if automate.puitsImplicite:
+        comp.puitsImplicite = True
+        AnalyseAutomate.materialiser_puits(comp)
+
+    comp.listFinaux = [e for e in comp.listEtats if all(f.idEtat != e.idEtat for f in automate.listFinaux)]
+
     return comp
 
 
-def sont_equivalents(a1: Automate, a2: Automate) -> bool:
-    """Teste si deux automates déterministes sont équivalents."""
-    # A et B sont équivalents ssi leur différence est vide dans les deux sens
-    from analyse import minimiser_automate  # si dispo
+def _fusionner_alphabets(resultat: Automate, *automates: Automate) -> Dict[str, Alphabet]:
+    """
+    Ajoute à resultat l'alphabet commun des automates (un symbole par valeur) et renvoie
+    le dictionnaire valeur -> symbole. Les objets Alphabet sont réutilisés, sauf en cas
+    de conflit d'identifiant entre deux valeurs différentes.
+    """
+    symboles: Dict[str, Alphabet] = {}
+    ids: Set[str] = set()
+    for automate in automates:
+        for a in automate.listAlphabets:
+            if a.valAlphabet in symboles:
+                continue
+            if a.idAlphabet in ids:
+                k = len(ids)
+                while f"{a.idAlphabet}_{k}" in ids:
+                    k += 1
+                nouvel_id = f"{a.idAlphabet}_{k}"
+                a = ClasseSymboles(nouvel_id, a.intervalles) if isinstance(a, ClasseSymboles) else Alphabet(nouvel_id, a.valAlphabet)
+            resultat.listAlphabets.append(a)
+            symboles[a.valAlphabet] = a
+            ids.add(a.idAlphabet)
+    return symboles
+
+
+def _recopier_etats(resultat: Automate, automate: Automate, prefixe: str,
+                    initiaux: Set[int], finaux: Set[int]) -> Tuple[List[Etat], Dict[str, int]]:
+    """
+    Recopie les états d'automate dans resultat sous les identifiants prefixe+indice
+    (uniques par construction : ajout direct aux listes, sans recherche de doublon).
+    initiaux et finaux sont les indices des états à marquer dans resultat.
+    Renvoie les nouveaux états et l'index idEtat d'origine -> indice.
+    """
+    etats = []
+    indices: Dict[str, int] = {}
+    for i, e in enumerate(automate.listEtats):
+        indices[e.idEtat] = i
+        etat = Etat(f"{prefixe}{i}", e.labelEtat,
+                    "initial" if i in initiaux else ("final" if i in finaux else "normal"))
+        etats.append(etat)
+        resultat.listEtats.append(etat)
+        if i in initiaux:
+            resultat.listInitiaux.append(etat)
+        if i in finaux:
+            resultat.listFinaux.append(etat)
+    return etats, indices
+
+
+def _ajouter_transition(resultat: Automate, source: Etat, dest: Etat, symbole: Alphabet) -> None:
+    resultat.listTransition.append(Transition(f"trans_{len(resultat.listTransition)}", source, dest, symbole))
+
+
+def _indices(automate: Automate, etats: List[Etat]) -> Set[int]:
+    """Indices (dans listEtats) des états fournis."""
+    ids = {e.idEtat for e in etats}
+    return {i for i, e in enumerate(automate.listEtats) if e.idEtat in ids}
+
+
+def concatenation_automates(a1: Automate, a2: Automate, emonder: bool = False) -> Automate:
+    """
+    Construit un AFN sans ε-transition reconnaissant L(a1)·L(a2), de taille linéaire.
+
+    Les états de a1 et a2 sont recopiés (A<i>, B<j>). Une transition de a1 qui mène à un
+    état final est doublée par une transition vers l'entrée de a2 : son unique état
+    initial, ou un état "B_entree" qui regroupe les transitions sortantes de ses états
+    initiaux s'il en a plusieurs. Les états initiaux de a2 sont aussi initiaux si ε ∈ L(a1),
+    et les finaux de a1 restent finaux si ε ∈ L(a2). Émondé si emonder=True.
+    """
+    resultat = Automate(f"{a1.nom}_concat_{a2.nom}", a1.est_compact())
+    symboles = _fusionner_alphabets(resultat, a1, a2)
+    initiaux1, finaux1 = _indices(a1, a1.listInitiaux), _indices(a1, a1.listFinaux)
+    initiaux2, finaux2 = _indices(a2, a2.listInitiaux), _indices(a2, a2.listFinaux)
+    vide1, vide2 = bool(initiaux1 & finaux1), bool(initiaux2 & finaux2)
+
+    etats1, indices1 = _recopier_etats(resultat, a1, "A", initiaux1, finaux1 if vide2 else set())
+    etats2, indices2 = _recopier_etats(resultat, a2, "B", initiaux2 if vide1 else set(), finaux2)
+    for t in a2.listTransition:
+        _ajouter_transition(resultat, etats2[indices2[t.etatSource.idEtat]],
+                            etats2[indices2[t.etatDestination.idEtat]], symboles[t.alphabet.valAlphabet])
+
+    if len(initiaux2) == 1:
+        entree = etats2[next(iter(initiaux2))]
+    else:
+        entree = Etat("B_entree", "B_entree", "final" if vide2 else "normal")
+        resultat.listEtats.append(entree)
+        if vide2:
+            resultat.listFinaux.append(entree)
+        for t in a2.listTransition:
+            if indices2[t.etatSource.idEtat] in initiaux2:
+                _ajouter_transition(resultat, entree, etats2[indices2[t.etatDestination.idEtat]],
+                                    symboles[t.alphabet.valAlphabet])
+
+    for t in a1.listTransition:
+        source = etats1[indices1[t.etatSource.idEtat]]
+        dest = indices1[t.etatDestination.idEtat]
+        symbole = symboles[t.alphabet.valAlphabet]
+        _ajouter_transition(resultat, source, etats1[dest], symbole)
+        if dest in finaux1 and initiaux2:
+            _ajouter_transition(resultat, source, entree, symbole)
+
+    if emonder:
+        AnalyseAutomate.emonder(resultat)
+    return resultat
+
+
+def etoile_automate(automate: Automate, emonder: bool = False) -> Automate:
+    """
+    Construit un AFN sans ε-transition reconnaissant L(automate)*, de taille linéaire.
 
-    comp1 = complement_automate(a1)
-    comp2 = complement_automate(a2)
+    Un nouvel état initial et final "S" reçoit les transitions sortantes des états initiaux ;
+    toute transition menant à un état final est doublée par une transition vers S, d'où
+    la lecture d'un nouveau mot peut reprendre. Émondé si emonder=True.
+    """
+    resultat = Automate(f"{automate.nom}_etoile", automate.est_compact())
+    symboles = _fusionner_alphabets(resultat, automate)
+    initiaux, finaux = _indices(automate, automate.listInitiaux), _indices(automate, automate.listFinaux)
 
-    inter1 = intersection_automates(a1, comp2)
-    inter2 = intersection_automates(a2, comp1)
+    depart = Etat("S", "S", "initial")
+    resultat.listEtats.append(depart)
+    resultat.listInitiaux.append(depart)
+    resultat.listFinaux.append(depart)
+    etats, indices = _recopier_etats(resultat, automate, "A", set(), finaux)
 
-    # S’ils reconnaissent ∅ alors ils n’ont pas d’états finaux accessibles
-    mots1 = generer_mots_acceptes(inter1, 5)
-    mots2 = generer_mots_acceptes(inter2, 5)
-    return not mots1 and not mots2
+    for t in automate.listTransition:
+        source = indices[t.etatSource.idEtat]
+        dest = indices[t.etatDestination.idEtat]
+        symbole = symboles[t.alphabet.valAlphabet]
+        _ajouter_transition(resultat, etats[source], etats[dest], symbole)
+        if dest in finaux:
+            _ajouter_transition(resultat, etats[source], depart, symbole)
+        if source in initiaux:
+            _ajouter_transition(resultat, depart, etats[dest], symbole)
+            if dest in finaux:
+                _ajouter_transition(resultat, depart, depart, symbole)
+
+    if emonder:
+        AnalyseAutomate.emonder(resultat)
+    return resultat
+
+
+def miroir_automate(automate: Automate, emonder: bool = False) -> Automate:
+    """
+    Construit l'automate miroir, reconnaissant les mots de L(automate) lus à l'envers :
+    les transitions sont inversées et les états initiaux et finaux échangés. Le résultat
+    est en général un AFN (plusieurs états initiaux possibles). Émondé si emonder=True.
+    """
+    resultat = Automate(f"{automate.nom}_miroir", automate.est_compact())
+    symboles = _fusionner_alphabets(resultat, automate)
+    etats, indices = _recopier_etats(resultat, automate, "A",
+                                     _indices(automate, automate.listFinaux),
+                                     _indices(automate, automate.listInitiaux))
+    for t in automate.listTransition:
+        _ajouter_transition(resultat, etats[indices[t.etatDestination.idEtat]],
+                            etats[indices[t.etatSource.idEtat]], symboles[t.alphabet.valAlphabet])
+    if emonder:
+        AnalyseAutomate.emonder(resultat)
+    return resultat
+
+
+def _index_afn(automate: Automate, classes_par_val: Dict[str, List[int]]) -> Dict[Tuple[str, int], List[str]]:
+    """Indexe les transitions d'un automate par (état source, classe de symboles)."""
+    index: Dict[Tuple[str, int], List[str]] = {}
+    for t in automate.listTransition:
+        for classe in classes_par_val.get(t.alphabet.valAlphabet, ()):
+            index.setdefault((t.etatSource.idEtat, classe), []).append(t.etatDestination.idEtat)
+    return index
+
+
+def _post(index: Dict[Tuple[str, int], List[str]], etats: FrozenSet[str], classe: int) -> FrozenSet[str]:
+    """Ensemble des états atteints depuis etats en lisant un symbole de la classe."""
+    return frozenset(dest for e in etats for dest in index.get((e, classe), ()))
+
+
+def est_inclus(a1: Automate, a2: Automate) -> Tuple[bool, Optional[str]]:
+    """
+    Teste si L(a1) ⊆ L(a2) pour deux AFN quelconques, sans déterminiser a2.
+    Les couples (état de a1, ensemble d'états de a2) sont explorés en largeur à la demande ;
+    un couple (p, S) est ignoré si un couple (p, S') avec S' ⊆ S a déjà été rencontré
+    (antichaîne) : tout mot rejeté depuis (p, S) l'est aussi depuis (p, S').
+    Un couple retiré de l'antichaîne par un couple plus petit, mais plus profond, reste
+    exploré : le retrait ne bloque que les ajouts ultérieurs, ce qui préserve l'ordre
+    du parcours en largeur et donc la minimalité du contre-exemple.
+    Retourne (True, None), ou (False, w) avec w un plus court mot de L(a1) absent de L(a2).
+    """
+    partition = PartitionAlphabet(a1.listAlphabets + a2.listAlphabets)
+    classes_par_val = partition.classes_par_valeur()
+    index1 = _index_afn(a1, classes_par_val)
+    index2 = _index_afn(a2, classes_par_val)
+    finaux1 = {e.idEtat for e in a1.listFinaux}
+    finaux2 = {e.idEtat for e in a2.listFinaux}
+    representants = [partition.representant(c) for c in range(partition.nb_classes)]
+
+    antichaine: Dict[str, List[FrozenSet[str]]] = {}
+    file = deque()
+
+    def visiter(etat: str, ensemble: FrozenSet[str], mot: str) -> bool:
+        """Ajoute le couple à explorer ; renvoie True si c'est un contre-exemple."""
+        if etat in finaux1 and not ensemble & finaux2:
+            return True
+        minimaux = antichaine.setdefault(etat, [])
+        if any(m <= ensemble for m in minimaux):
+            return False
+        minimaux[:] = [m for m in minimaux if not ensemble <= m]
+        minimaux.append(ensemble)
+        file.append((etat, ensemble, mot))
+        return False
+
+    initiaux2 = frozenset(e.idEtat for e in a2.listInitiaux)
+    for e in a1.listInitiaux:
+        if visiter(e.idEtat, initiaux2, ""):
+            return False, ""
+    while file:
+        etat, ensemble, mot = file.popleft()
+        for classe, symbole in enumerate(representants):
+            suivants = index1.get((etat, classe))
+            if not suivants:
+                continue
+            ensemble_suivant = _post(index2, ensemble, classe)
+            for suivant in suivants:
+                if visiter(suivant, ensemble_suivant, mot + symbole):
+                    return False, mot + symbole
+    return True, None
+
+
+def est_universel(automate: Automate) -> Tuple[bool, Optional[str]]:
+    """
+    Teste si un AFN reconnaît tous les mots sur son alphabet, sans le déterminiser.
+    Les ensembles d'états sont explorés en largeur à la demande en ne gardant que les
+    ensembles minimaux pour l'inclusion (antichaîne) : si S ⊆ S', S' ne peut rejeter
+    un mot que S accepte. Comme dans est_inclus, un ensemble retiré de l'antichaîne
+    après son ajout à la file est tout de même exploré, pour garder un plus court mot.
+    Retourne (True, None), ou (False, w) avec w un plus court mot rejeté.
+    """
+    partition = PartitionAlphabet(automate.listAlphabets)
+    classes_par_val = partition.classes_par_valeur()
+    index = _index_afn(automate, classes_par_val)
+    finaux = {e.idEtat for e in automate.listFinaux}
+    representants = [partition.representant(c) for c in range(partition.nb_classes)]
+
+    initiaux = frozenset(e.idEtat for e in automate.listInitiaux)
+    if not initiaux & finaux:
+        return False, ""
+    antichaine: List[FrozenSet[str]] = [initiaux]
+    file = deque([(initiaux, "")])
+    while file:
+        ensemble, mot = file.popleft()
+        for classe, symbole in enumerate(representants):
+            suivant = _post(index, ensemble, classe)
+            if not suivant & finaux:
+                return False, mot + symbole
+            if any(m <= suivant for m in antichaine):
+                continue
+            antichaine = [m for m in antichaine if not suivant <= m]
+            antichaine.append(suivant)
+            file.append((suivant, mot + symbole))
+    return True, None
+
+
+def sont_equivalents(a1: Automate, a2: Automate) -> bool:
+    """Teste si deux automates (AFD ou AFN) sont équivalents, par double inclusion."""
+    # A et B sont équivalents ssi chacun est inclus dans l'autre
+    return est_inclus(a1, a2)[0] and est_inclus(a2, a1)[0]
 
 
 # --- Interface de test CLI ---
 if __name__ == "__main__":
+    # Vérification : union de deux automates complétés par un puits implicite
+    def _mot_unique(nom: str, lettre: str) -> Automate:
+        a = Automate(nom)
+        for i, val in enumerate("ab"):
+            a.ajouter_alphabet(Alphabet(f"s{i}", val))
+        q0, q1 = Etat("q0", "q0", "initial"), Etat("q1", "q1", "final")
+        a.ajouter_etat(q0)
+        a.ajouter_etat(q1)
+        a.ajouter_transition(Transition("trans_0", q0, q1, next(s for s in a.listAlphabets if s.valAlphabet == lettre)))
+        return AnalyseAutomate.completer(a, implicite=True)
+
+    union = union_automates(_mot_unique("A", "a"), _mot_unique("B", "b"))
+    assert simuler_mot(union, "a") and simuler_mot(union, "b") and not simuler_mot(union, "ab")
+    print("Union avec puits implicites : OK")
+
     automate = Automate.charger_json("exemple1")
     mot = "abba"
     print(f"Mot '{mot}' accepté ? {simuler_mot(automate, mot)}")
@@ -0,0 +1,185 @@
+from model import Automate
+from Analyse import AnalyseAutomate
+from moteur import AutomateCompile
+from typing import Callable, Dict, Iterator, List, Optional, Set, TextIO, BinaryIO, Tuple, Union
+
+
+class Lexeur:
+    """
+    Analyseur lexical à correspondance la plus longue (« maximal munch »).
+
+    Les règles sont des automates déterministes compilés (AutomateCompile). Elles sont
+    simulées ensemble sur un automate produit construit paresseusement : un état du
+    produit est le tuple des états des règles, et ses transitions sont mises en cache
+    au premier passage, si bien que chaque caractère lu coûte une recherche de
+    dictionnaire. Le type d'un état du produit est celui de la première règle (dans
+    l'ordre fourni) qui accepte. La lecture d'un lexème s'arrête dès que toutes les
+    règles sont bloquées, et le lexème suivant repart de la dernière position
+    acceptante : l'entrée lue au-delà est relue.
+
+    Pour que ces relectures restent en temps linéaire, les couples (état du produit,
+    position) visités après la dernière acceptation d'une lecture sont mémorisés comme
+    échecs (correspondance la plus longue en temps linéaire de Reps) : une lecture
+    ultérieure qui retombe sur l'un d'eux s'arrête aussitôt. Chaque couple n'est
+    ainsi parcouru au-delà d'une acceptation qu'une seule fois, d'où un temps en
+    O(|produit|·n) ; les échecs antérieurs au lexème courant sont oubliés au fur et à mesure.
+    """
+
+    MORT = -1
+
+    def __init__(self, automates: List[Automate]):
+        """
+        Construit un lexeur à partir d'une liste ordonnée d'automates : le type d'un lexème
+        est le nom de l'automate qui le reconnaît ; en cas d'égalité de longueur, le premier
+        automate de la liste l'emporte. Les automates non déterministes sont déterminisés.
+        """
+        regles = []
+        for automate in automates:
+            nom = automate.nom  # determiniser renomme l'automate en « <nom>_AFD »
+            if not AnalyseAutomate.est_deterministe(automate):
+                automate = AnalyseAutomate.determiniser(automate)
+            regles.append((automate, {e.idEtat: nom for e in automate.listFinaux}))
+        self._initialiser(regles)
+
+    @classmethod
+    def depuis_etats_etiquetes(cls, automate: Automate, etiquettes: Optional[Dict[str, str]] = None) -> 'Lexeur':
+        """
+        Construit un lexeur à partir d'un seul automate déterministe dont chaque état final
+        porte un type de lexème : etiquettes[idEtat] s'il est fourni, sinon le label de l'état.
+        """
+        if not AnalyseAutomate.est_deterministe(automate):
+            raise ValueError("L'automate à états étiquetés doit être déterministe.")
+        etiquettes = etiquettes or {}
+        types = {e.idEtat: etiquettes.get(e.idEtat, e.labelEtat) for e in automate.listFinaux}
+        lexeur = cls.__new__(cls)
+        lexeur._initialiser([(automate, types)])
+        return lexeur
+
+    def _initialiser(self, regles: List[Tuple[Automate, Dict[str, str]]]) -> None:
+        self._regles: List[AutomateCompile] = []
+        self._types_regles: List[List[Optional[str]]] = []
+        for automate, types in regles:
+            table = AutomateCompile(automate)
+            types_etats: List[Optional[str]] = [None] * table.nb_etats
+            for idEtat, type_lexeme in types.items():
+                types_etats[table.indices[idEtat]] = type_lexeme
+            self._elaguer(table, types_etats)
+            self._regles.append(table)
+            self._types_regles.append(types_etats)
+        self._index: Dict[Tuple[int, ...], int] = {}
+        self._composantes: List[Tuple[int, ...]] = []
+        self._types: List[Optional[str]] = []
+        self._transitions: List[Dict[Union[str, int], int]] = []
+        self.initial = self._etat_produit(tuple(r.initial for r in self._regles))
+
+    @staticmethod
+    def _elaguer(table: AutomateCompile, types_etats: List[Optional[str]]) -> None:
+        """
+        Redirige vers PUITS les transitions menant à un état d'où aucun état typé n'est
+        accessible (l'état ∅ de determiniser, le puits matérialisé par completer...) :
+        sans cela, le produit n'atteint jamais MORT et chaque lecture irait jusqu'au bout de l'entrée.
+        """
+        nb_classes = table.nb_classes
+        predecesseurs: List[List[int]] = [[] for _ in range(table.nb_etats)]
+        for source in range(table.nb_etats):
+            for dest in table.table[source * nb_classes:(source + 1) * nb_classes]:
+                if dest != AutomateCompile.PUITS:
+                    predecesseurs[dest].append(source)
+        vivants = [type_lexeme is not None for type_lexeme in types_etats]
+        pile = [etat for etat, vivant in enumerate(vivants) if vivant]
+        while pile:
+            for source in predecesseurs[pile.pop()]:
+                if not vivants[source]:
+                    vivants[source] = True
+                    pile.append(source)
+        for k, dest in enumerate(table.table):
+            if dest != AutomateCompile.PUITS and not vivants[dest]:
+                table.table[k] = AutomateCompile.PUITS
+
+    def _etat_produit(self, composantes: Tuple[int, ...]) -> int:
+        """Renvoie le numéro de l'état produit (MORT si toutes les règles sont bloquées)."""
+        if all(c == AutomateCompile.PUITS for c in composantes):
+            return self.MORT
+        etat = self._index.get(composantes)
+        if etat is None:
+            etat = len(self._composantes)
+            self._index[composantes] = etat
+            self._composantes.append(composantes)
+            self._transitions.append({})
+            self._types.append(next((types[c] for types, c in zip(self._types_regles, composantes)
+                                     if c != AutomateCompile.PUITS and types[c] is not None), None))
+        return etat
+
+    def _suivant(self, etat: int, caractere: Union[str, int]) -> int:
+        suivant = self._transitions[etat].get(caractere)
+        if suivant is None:
+            suivant = self._etat_produit(tuple(r.transiter(c, caractere)
+                                               for r, c in zip(self._regles, self._composantes[etat])))
+            self._transitions[etat][caractere] = suivant
+        return suivant
+
+    def analyser(self, texte: Union[str, bytes]) -> Iterator[Tuple[str, int, int]]:
+        """Découpe le texte en lexèmes (type, début, fin), fin exclue."""
+        morceaux = iter((texte,))
+        return self._analyser(lambda: next(morceaux, texte[:0]))
+
+    def analyser_flux(self, flux: Union[TextIO, BinaryIO], taille_bloc: int = 65536) -> Iterator[Tuple[str, int, int]]:
+        """Découpe un flux (fichier texte ou binaire) lu par blocs ; les positions sont absolues."""
+        return self._analyser(lambda: flux.read(taille_bloc))
+
+    def _analyser(self, lire: Callable[[], Union[str, bytes]]) -> Iterator[Tuple[str, int, int]]:
+        tampon = lire()
+        epuise = not tampon
+        decalage = 0  # position absolue de tampon[0]
+        debut = 0     # début du lexème courant dans le tampon
+        echecs: Dict[int, Set[int]] = {}  # position absolue -> états du produit sans acceptation au-delà
+        oubli = 0     # positions antérieures déjà retirées de echecs
+        while True:
+            if debut == len(tampon):
+                if epuise:
+                    return
+                morceau = lire()
+                if not morceau:
+                    return
+                decalage += debut
+                tampon, debut = morceau, 0
+            etat = self.initial
+            type_lexeme, fin = None, -1
+            visites: List[Tuple[int, int]] = []  # (position absolue, état) depuis la dernière acceptation
+            i = debut
+            while True:
+                position = decalage + i
+                if etat in echecs.get(position, ()):
+                    break  # déjà exploré : aucune acceptation plus loin
+                visites.append((position, etat))
+                if i == len(tampon):
+                    morceau = None if epuise else lire()
+                    if not morceau:
+                        epuise = True
+                        break
+                    # On ne garde que le lexème en cours avant d'ajouter le bloc suivant
+                    tampon = tampon[debut:] + morceau
+                    decalage += debut
+                    i -= debut
+                    fin = fin - debut if fin >= 0 else fin
+                    debut = 0
+                etat = self._suivant(etat, tampon[i])
+                if etat == self.MORT:
+                    break
+                i += 1
+                if self._types[etat] is not None:
+                    type_lexeme, fin = self._types[etat], i
+                    visites.clear()
+            for position, etat in visites:
+                echecs.setdefault(position, set()).add(etat)
+            if type_lexeme is None:
+                raise ValueError(f"Aucun lexème reconnu à la position {decalage + debut}.")
+            yield (type_lexeme, decalage + debut, decalage + fin)
+            debut = fin
+            # Les lexèmes suivants ne reliront rien avant fin
+            for position in range(oubli, decalage + fin):
+                echecs.pop(position, None)
+            oubli = max(oubli, decalage + fin)
+
+    def __repr__(self) -> str:
+        return f"Lexeur(règles={len(self._regles)}, états produit={len(self._composantes)})"
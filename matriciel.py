@@ -0,0 +1,175 @@
+from model import Automate
+from moteur import numeroter_etats
+from symboles import PartitionAlphabet
+from typing import Dict, Iterable, List, Optional, Union
+import numpy as np
+
+try:
+    from scipy import sparse
+except ImportError:  # SciPy est optionnel : matrices denses NumPy à défaut
+    sparse = None
+
+
+class MoteurMatriciel:
+    """
+    Simulation d'un AFN par produits matriciels.
+
+    Pour chaque classe de symboles (voir PartitionAlphabet), la relation de transition
+    est une matrice d'adjacence n×n (CSR SciPy si disponible, sinon tableau NumPy).
+    Un lot de configurations est une matrice booléenne k×n dont chaque ligne est un
+    ensemble d'états actifs : un pas de simulation de toutes les lignes lisant la même
+    classe est un seul produit matriciel, au lieu de manipulations d'ensembles Python.
+    Les matrices de simulation sont booléennes ; le comptage de chemins construit à la
+    demande des matrices entières (int64) pondérées par la taille des classes.
+    """
+
+    def __init__(self, automate: Automate, creux: Optional[bool] = None):
+        """
+        Args:
+            automate (Automate): Automate (AFD ou AFN) à compiler.
+            creux (Optional[bool]): Force (True) ou interdit (False) les matrices creuses CSR ;
+                par défaut, elles sont utilisées si SciPy est installé.
+        """
+        if creux and sparse is None:
+            raise ValueError("Les matrices creuses nécessitent SciPy.")
+        self.creux = sparse is not None if creux is None else creux
+        self.partition = PartitionAlphabet(automate.listAlphabets)
+        self.indices = numeroter_etats(automate)
+        self.nb_etats = len(self.indices)
+        self.nb_classes = self.partition.nb_classes
+        self.initiaux = self.vecteur(e.idEtat for e in automate.listInitiaux)
+        self.finaux = self.vecteur(e.idEtat for e in automate.listFinaux)
+
+        classes_par_val = self.partition.classes_par_valeur()
+        lignes: List[List[int]] = [[] for _ in range(self.nb_classes)]
+        colonnes: List[List[int]] = [[] for _ in range(self.nb_classes)]
+        for t in automate.listTransition:
+            src = self.indices[t.etatSource.idEtat]
+            dest = self.indices[t.etatDestination.idEtat]
+            for classe in classes_par_val.get(t.alphabet.valAlphabet, ()):
+                lignes[classe].append(src)
+                colonnes[classe].append(dest)
+        self.matrices = [self._matrice(l, c) for l, c in zip(lignes, colonnes)]
+        # Nombre de caractères de chaque classe (1 pour un symbole non caractère)
+        self.tailles_classes = [sum(fin - debut + 1 for debut, fin in intervalles) or 1
+                                for intervalles in self.partition.intervalles_classes]
+
+    def _matrice(self, lignes: List[int], colonnes: List[int]):
+        """Matrice d'adjacence booléenne (les transitions en double ne comptent qu'une fois)."""
+        n = self.nb_etats
+        if self.creux:
+            matrice = sparse.csr_matrix((np.ones(len(lignes), dtype=bool), (lignes, colonnes)), shape=(n, n))
+            matrice.sum_duplicates()
+            return matrice
+        matrice = np.zeros((n, n), dtype=bool)
+        matrice[lignes, colonnes] = True
+        return matrice
+
+    def vecteur(self, idEtats: Iterable[str]) -> np.ndarray:
+        """Vecteur booléen d'un ensemble d'états."""
+        vecteur = np.zeros(self.nb_etats, dtype=bool)
+        vecteur[[self.indices[i] for i in idEtats]] = True
+        return vecteur
+
+    def _etape(self, configurations: np.ndarray, classe: int) -> np.ndarray:
+        """Fait avancer toutes les lignes de configurations d'un symbole de la classe."""
+        return np.asarray(configurations @ self.matrices[classe], dtype=bool)
+
+    def atteindre(self, mot: Union[str, bytes], departs: Optional[List[Iterable[str]]] = None) -> np.ndarray:
+        """
+        Simule un même mot depuis plusieurs configurations de départ (une par ligne ;
+        par défaut les états initiaux) et renvoie la matrice k×n des états atteints.
+        """
+        if departs is None:
+            configurations = self.initiaux[np.newaxis, :].copy()
+        else:
+            configurations = np.array([self.vecteur(d) for d in departs], dtype=bool).reshape(-1, self.nb_etats)
+        for caractere in mot:
+            classe = self.partition.classe_de(caractere)
+            if classe < 0:
+                configurations[:] = False
+                break
+            configurations = self._etape(configurations, classe)
+        return configurations
+
+    def simuler_depuis(self, mot: Union[str, bytes], departs: List[Iterable[str]]) -> List[bool]:
+        """Indique, pour chaque configuration de départ, si le mot mène à un état final."""
+        return (self.atteindre(mot, departs) & self.finaux).any(axis=1).tolist()
+
+    def simuler_lot(self, mots: List[Union[str, bytes]]) -> List[bool]:
+        """
+        Simule un lot de mots en parallèle. À chaque position, les mots sont regroupés
+        par classe du symbole lu et chaque groupe avance en un seul produit matriciel.
+        """
+        configurations = np.tile(self.initiaux, (len(mots), 1))
+        longueur_max = max((len(m) for m in mots), default=0)
+        for position in range(longueur_max):
+            groupes: Dict[int, List[int]] = {}
+            for i, mot in enumerate(mots):
+                if position < len(mot):
+                    groupes.setdefault(self.partition.classe_de(mot[position]), []).append(i)
+            for classe, lignes in groupes.items():
+                if classe < 0:
+                    configurations[lignes] = False
+                else:
+                    configurations[lignes] = self._etape(configurations[lignes], classe)
+        return (configurations & self.finaux).any(axis=1).tolist()
+
+    # --- Comptage de chemins ---
+    def matrice_transitions(self, classe: Optional[int] = None):
+        """
+        Matrice entière du nombre de caractères menant de i à j : celle d'une classe
+        (adjacence × taille de la classe), ou leur somme sur toutes les classes.
+        """
+        if classe is not None:
+            return self.matrices[classe].astype(np.int64) * self.tailles_classes[classe]
+        if self.creux:
+            total = sparse.csr_matrix((self.nb_etats, self.nb_etats), dtype=np.int64)
+        else:
+            total = np.zeros((self.nb_etats, self.nb_etats), dtype=np.int64)
+        for classe, matrice in enumerate(self.matrices):
+            total = total + matrice.astype(np.int64) * self.tailles_classes[classe]
+        return total
+
+    def puissance(self, n: int, classe: Optional[int] = None):
+        """
+        Renvoie M^n par exponentiation rapide (M = matrice_transitions) : le coefficient
+        (i, j) est le nombre de chemins de longueur n de i à j, chaque transition étiquetée
+        par une classe comptant pour ses caractères (entiers 64 bits : attention au dépassement).
+        """
+        if n < 0:
+            raise ValueError("La puissance doit être positive.")
+        base = self.matrice_transitions(classe)
+        if self.creux:
+            resultat = sparse.identity(self.nb_etats, dtype=np.int64, format="csr")
+        else:
+            resultat = np.eye(self.nb_etats, dtype=np.int64)
+        while n:
+            if n & 1:
+                resultat = resultat @ base
+            base = base @ base
+            n >>= 1
+        return resultat
+
+    def compter_chemins(self, n: int) -> int:
+        """
+        Nombre de chemins acceptants de longueur n, une transition sur une classe comptant
+        pour chacun de ses caractères : c'est le nombre de mots acceptés de longueur n si
+        l'automate est déterministe sur les caractères (ses symboles ne se chevauchent pas).
+        """
+        return int(self.initiaux.astype(np.int64) @ (self.puissance(n) @ self.finaux.astype(np.int64)))
+
+    def compter_chemins_par_longueur(self, n: int) -> List[int]:
+        """Nombres de chemins acceptants de longueurs 0 à n, par itération vecteur-matrice."""
+        total = self.matrice_transitions()
+        courant = self.initiaux.astype(np.int64)
+        finaux = self.finaux.astype(np.int64)
+        comptes = []
+        for _ in range(n + 1):
+            comptes.append(int(courant @ finaux))
+            courant = np.asarray(courant @ total).ravel()
+        return comptes
+
+    def __repr__(self) -> str:
+        mode = "CSR" if self.creux else "dense"
+        return f"MoteurMatriciel(états={self.nb_etats}, classes={self.nb_classes}, matrices={mode})"
@@ -1,8 +1,12 @@
-import json, os
-from typing import List, Dict, Optional, Set
+import json, os, sys
+from array import array
+from bisect import bisect_right
+from collections.abc import MutableSequence
+from typing import List, Dict, Optional, Set, Callable, Iterable, Iterator, Tuple, Union
 
 class Etat:
     """Classe représentant un état dans un automate."""
+    __slots__ = ("idEtat", "labelEtat", "typeEtat")
     
     def __init__(self, idEtat: str, labelEtat: str, typeEtat: str = "normal"):
         """
@@ -14,8 +18,8 @@ class Etat:
             typeEtat (str): Type de l'état ("initial", "final", ou "normal").
         """
         self.idEtat = idEtat
-        self.labelEtat = labelEtat
-        self.typeEtat = typeEtat.lower()  # Uniformisation en minuscules
+        self.labelEtat = sys.intern(labelEtat)
+        self.typeEtat = sys.intern(typeEtat.lower())  # Uniformisation en minuscules
 
     # Getters
     def get_idEtat(self) -> str:
@@ -29,11 +33,11 @@ class Etat:
 
     # Setters
     def set_labelEtat(self, new_label: str) -> None:
-        self.labelEtat = new_label
+        self.labelEtat = sys.intern(new_label)
 
     def set_typeEtat(self, new_type: str) -> None:
         if new_type.lower() in {"initial", "final", "normal"}:
-            self.typeEtat = new_type.lower()
+            self.typeEtat = sys.intern(new_type.lower())
         else:
             raise ValueError("Type d'état invalide. Choisir parmi 'initial', 'final', ou 'normal'.")
 
@@ -42,6 +46,7 @@ class Etat:
 
 class Alphabet:
     """Classe représentant un symbole dans l'alphabet d'un automate."""
+    __slots__ = ("idAlphabet", "valAlphabet")
     
     def __init__(self, idAlphabet: str, valAlphabet: str):
         """
@@ -52,7 +57,7 @@ class Alphabet:
             valAlphabet (str): Valeur du symbole (ex: 'a', '0').
         """
         self.idAlphabet = idAlphabet
-        self.valAlphabet = valAlphabet
+        self.valAlphabet = sys.intern(valAlphabet)
 
     # Getters
     def get_idAlphabet(self) -> str:
@@ -63,13 +68,173 @@ class Alphabet:
 
     # Setters
     def set_valAlphabet(self, new_val: str) -> None:
-        self.valAlphabet = new_val
+        self.valAlphabet = sys.intern(new_val)
 
     def __repr__(self) -> str:
         return f"Alphabet(id={self.idAlphabet}, val={self.valAlphabet})"
 
+class ClasseSymboles(Alphabet):
+    """
+    Symbole représentant une classe de caractères (intervalles et ensembles de points de code).
+    Une seule transition étiquetée par une classe remplace une transition par caractère.
+    """
+    __slots__ = ("intervalles",)
+
+    MAX_CODE = 0x10FFFF
+    _SPECIAUX = set("[]\\-^")
+    _ECHAPPEMENTS = {"n": "\n", "t": "\t", "r": "\r"}
+
+    def __init__(self, idAlphabet: str, intervalles: List[Tuple[int, int]]):
+        """
+        Constructeur de la classe ClasseSymboles.
+
+        Args:
+            idAlphabet (str): Identifiant unique du symbole.
+            intervalles (List[Tuple[int, int]]): Intervalles [début, fin] (inclus) de points de code.
+        """
+        self.intervalles: List[Tuple[int, int]] = ClasseSymboles._normaliser(intervalles)
+        if not self.intervalles:
+            raise ValueError(f"La classe de symboles {idAlphabet} est vide.")
+        super().__init__(idAlphabet, ClasseSymboles._vers_texte(self.intervalles))
+
+    @classmethod
+    def depuis_texte(cls, idAlphabet: str, texte: str) -> 'ClasseSymboles':
+        """
+        Construit une classe depuis une description de la forme "[a-z0-9_]" ou "[^\\x00-\\x1f]".
+        Les échappements \\xHH, \\uHHHH, \\UHHHHHHHH, \\n, \\t et \\r sont acceptés, ainsi que
+        \\[ \\] \\- \\^ \\\\ ; tout autre échappement lève ValueError, de même qu'une classe vide.
+        """
+        if texte.startswith("[") and texte.endswith("]") and len(texte) >= 2:
+            texte = texte[1:-1]
+        negation = texte.startswith("^")
+        if negation:
+            texte = texte[1:]
+        jetons: List[Tuple[int, bool]] = []  # (point de code, échappé)
+        i = 0
+        while i < len(texte):
+            if texte[i] == "\\":
+                echappe = texte[i + 1:i + 2]
+                longueur = {"x": 2, "u": 4, "U": 8}.get(echappe)
+                if longueur:
+                    chiffres = texte[i + 2:i + 2 + longueur]
+                    if len(chiffres) != longueur or any(c not in "0123456789abcdefABCDEF" for c in chiffres):
+                        raise ValueError(f"Echappement invalide dans la classe de symboles : \\{echappe}{chiffres}.")
+                    code = int(chiffres, 16)
+                    if code > cls.MAX_CODE:
+                        raise ValueError(f"Point de code hors limites dans la classe de symboles : \\{echappe}{chiffres}.")
+                    jetons.append((code, True))
+                    i += 2 + longueur
+                elif echappe in cls._ECHAPPEMENTS:
+                    jetons.append((ord(cls._ECHAPPEMENTS[echappe]), True))
+                    i += 2
+                elif echappe in cls._SPECIAUX:
+                    jetons.append((ord(echappe), True))
+                    i += 2
+                elif echappe:
+                    raise ValueError(f"Echappement inconnu dans la classe de symboles : \\{echappe}.")
+                else:
+                    raise ValueError("Classe de symboles invalide : '\\' final.")
+            else:
+                jetons.append((ord(texte[i]), False))
+                i += 1
+        # Un tiret non échappé entre deux caractères délimite un intervalle
+        tiret = (ord("-"), False)
+        intervalles: List[Tuple[int, int]] = []
+        j = 0
+        while j < len(jetons):
+            debut = jetons[j][0]
+            if j + 2 < len(jetons) and jetons[j + 1] == tiret:
+                fin = jetons[j + 2][0]
+                if fin < debut:
+                    raise ValueError(f"Intervalle invalide dans la classe de symboles : {chr(debut)}-{chr(fin)}.")
+                intervalles.append((debut, fin))
+                j += 3
+            else:
+                intervalles.append((debut, debut))
+                j += 1
+        if negation:
+            intervalles = ClasseSymboles._complementer(ClasseSymboles._normaliser(intervalles))
+        return cls(idAlphabet, intervalles)
+
+    @staticmethod
+    def _normaliser(intervalles: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """Trie et fusionne les intervalles qui se chevauchent ou se touchent."""
+        resultat: List[Tuple[int, int]] = []
+        for debut, fin in sorted(intervalles):
+            if debut > fin:
+                raise ValueError(f"Intervalle invalide : ({debut}, {fin}).")
+            if resultat and debut <= resultat[-1][1] + 1:
+                resultat[-1] = (resultat[-1][0], max(resultat[-1][1], fin))
+            else:
+                resultat.append((debut, fin))
+        return resultat
+
+    @staticmethod
+    def _complementer(intervalles: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        resultat: List[Tuple[int, int]] = []
+        suivant = 0
+        for debut, fin in intervalles:
+            if debut > suivant:
+                resultat.append((suivant, debut - 1))
+            suivant = fin + 1
+        if suivant <= ClasseSymboles.MAX_CODE:
+            resultat.append((suivant, ClasseSymboles.MAX_CODE))
+        return resultat
+
+    @staticmethod
+    def _caractere_vers_texte(code: int) -> str:
+        caractere = chr(code)
+        if caractere in ClasseSymboles._SPECIAUX:
+            return "\\" + caractere
+        if caractere.isprintable() and not caractere.isspace():
+            return caractere
+        if code <= 0xFF:
+            return f"\\x{code:02x}"
+        if code <= 0xFFFF:
+            return f"\\u{code:04x}"
+        return f"\\U{code:08x}"
+
+    @staticmethod
+    def _vers_texte(intervalles: List[Tuple[int, int]]) -> str:
+        morceaux = []
+        for debut, fin in intervalles:
+            morceaux.append(ClasseSymboles._caractere_vers_texte(debut))
+            if fin > debut:
+                morceaux.append("-" + ClasseSymboles._caractere_vers_texte(fin))
+        return "[" + "".join(morceaux) + "]"
+
+    def contient(self, caractere: str) -> bool:
+        """Indique si le caractère appartient à la classe."""
+        code = ord(caractere)
+        i = bisect_right(self.intervalles, (code, ClasseSymboles.MAX_CODE + 1)) - 1
+        return i >= 0 and self.intervalles[i][0] <= code <= self.intervalles[i][1]
+
+    def representant(self) -> str:
+        """Renvoie un caractère quelconque de la classe (le plus petit)."""
+        return chr(self.intervalles[0][0])
+
+    def set_valAlphabet(self, new_val: str) -> None:
+        self.intervalles = ClasseSymboles.depuis_texte(self.idAlphabet, new_val).intervalles
+        self.valAlphabet = sys.intern(ClasseSymboles._vers_texte(self.intervalles))
+
+    def __repr__(self) -> str:
+        return f"ClasseSymboles(id={self.idAlphabet}, val={self.valAlphabet})"
+
+def alphabet_vers_json(alphabet: Alphabet) -> Dict:
+    """Représentation JSON d'un symbole (les classes de symboles gardent leurs intervalles)."""
+    if isinstance(alphabet, ClasseSymboles):
+        return {"id": alphabet.idAlphabet, "val": alphabet.valAlphabet, "intervalles": alphabet.intervalles}
+    return {"id": alphabet.idAlphabet, "val": alphabet.valAlphabet}
+
+def alphabet_depuis_json(data: Dict) -> Alphabet:
+    """Reconstruit un symbole à partir de sa représentation JSON."""
+    if "intervalles" in data:
+        return ClasseSymboles(data["id"], [tuple(i) for i in data["intervalles"]])
+    return Alphabet(data["id"], data["val"])
+
 class Transition:
     """Classe représentant une transition entre deux états dans un automate."""
+    __slots__ = ("idTransition", "etatSource", "etatDestination", "alphabet")
     
     def __init__(self, idTransition: str, etatSource: Etat, etatDestination: Etat, alphabet: Alphabet):
         """
@@ -112,22 +277,499 @@ class Transition:
     def __repr__(self) -> str:
         return f"Transition(id={self.idTransition}, source={self.etatSource.idEtat}, dest={self.etatDestination.idEtat}, symbole={self.alphabet.valAlphabet})"
 
+class _TransitionVue(Transition):
+    """
+    Transition matérialisée à la demande depuis un stockage colonnaire.
+    Les getters et setters lisent/écrivent directement dans les colonnes ; la vue
+    reste valide tant qu'aucune ligne précédente n'est supprimée du stockage.
+    """
+    __slots__ = ("_stockage", "_ligne")
+
+    def __init__(self, stockage: 'TransitionsColonnaires', ligne: int):
+        self._stockage = stockage
+        self._ligne = ligne
+
+    @property
+    def idTransition(self) -> str:
+        return self._stockage._decoder_id(self._stockage._numero[self._ligne])
+
+    @idTransition.setter
+    def idTransition(self, new_id: str) -> None:
+        stockage = self._stockage
+        ancien = stockage._numero[self._ligne]
+        stockage._numero[self._ligne] = stockage._encoder_id(new_id)
+        stockage._liberer_id(ancien)
+
+    @property
+    def etatSource(self) -> Etat:
+        return self._stockage._etats[self._stockage._source[self._ligne]]
+
+    @etatSource.setter
+    def etatSource(self, new_source: Etat) -> None:
+        stockage = self._stockage
+        ancien = stockage._source[self._ligne]
+        stockage._source[self._ligne] = stockage._indice_etat(new_source)
+        stockage._liberer_etat(ancien)
+
+    @property
+    def etatDestination(self) -> Etat:
+        return self._stockage._etats[self._stockage._dest[self._ligne]]
+
+    @etatDestination.setter
+    def etatDestination(self, new_dest: Etat) -> None:
+        stockage = self._stockage
+        ancien = stockage._dest[self._ligne]
+        stockage._dest[self._ligne] = stockage._indice_etat(new_dest)
+        stockage._liberer_etat(ancien)
+
+    @property
+    def alphabet(self) -> Alphabet:
+        return self._stockage._alphabets[self._stockage._symbole[self._ligne]]
+
+    @alphabet.setter
+    def alphabet(self, new_alphabet: Alphabet) -> None:
+        stockage = self._stockage
+        ancien = stockage._symbole[self._ligne]
+        stockage._symbole[self._ligne] = stockage._indice_alphabet(new_alphabet)
+        stockage._liberer_alphabet(ancien)
+
+class ListeBlocs(MutableSequence):
+    """
+    Séquence découpée en blocs qui peuvent être partagés entre versions d'un automate.
+
+    copie() ne duplique que la liste des blocs (n/TAILLE_BLOC références) ; ensuite,
+    chaque version ne copie un bloc qu'au moment d'y écrire, si bien qu'une modification
+    après une copie coûte O(TAILLE_BLOC) au lieu de O(n). Les blocs sont des listes,
+    ou des array du code de type fourni (colonnes de TransitionsColonnaires).
+    """
+    __slots__ = ("_code", "_blocs", "_propres", "_fins")
+
+    TAILLE_BLOC = 256
+
+    def __init__(self, elements: Iterable = (), code: Optional[str] = None):
+        self._code = code
+        self._blocs: List = []
+        self._propres: List[bool] = []  # bloc appartenant à cette seule version (modifiable sur place)
+        self._fins: List[int] = []      # indice suivant le dernier élément de chaque bloc
+        if not isinstance(elements, (list, array)):
+            elements = list(elements)
+        for debut in range(0, len(elements), self.TAILLE_BLOC):
+            self._ajouter_bloc(self._nouveau_bloc(elements[debut:debut + self.TAILLE_BLOC]), True)
+
+    def _nouveau_bloc(self, elements: Iterable = ()):
+        return array(self._code, elements) if self._code else list(elements)
+
+    def _ajouter_bloc(self, bloc, propre: bool) -> None:
+        self._blocs.append(bloc)
+        self._propres.append(propre)
+        self._fins.append(len(self) + len(bloc))
+
+    def _localiser(self, indice: int) -> Tuple[int, int]:
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("Indice hors limites.")
+        b = bisect_right(self._fins, indice)
+        return b, indice - (self._fins[b - 1] if b else 0)
+
+    def _bloc_propre(self, b: int):
+        """Renvoie le bloc b, copié au préalable s'il est partagé avec une autre version."""
+        if not self._propres[b]:
+            self._blocs[b] = self._blocs[b][:]
+            self._propres[b] = True
+        return self._blocs[b]
+
+    def copie(self) -> 'ListeBlocs':
+        """Nouvelle version partageant tous les blocs ; les deux versions les copieront à l'écriture."""
+        copie = ListeBlocs.__new__(ListeBlocs)
+        copie._code = self._code
+        copie._blocs = list(self._blocs)
+        copie._fins = list(self._fins)
+        self._propres = [False] * len(self._blocs)
+        copie._propres = [False] * len(self._blocs)
+        return copie
+
+    # --- Protocole MutableSequence ---
+    def __len__(self) -> int:
+        return self._fins[-1] if self._fins else 0
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [self[i] for i in range(*indice.indices(len(self)))]
+        b, position = self._localiser(indice)
+        return self._blocs[b][position]
+
+    def __setitem__(self, indice, valeur) -> None:
+        if isinstance(indice, slice):
+            elements = list(self)
+            elements[indice] = valeur
+            self.__init__(elements, self._code)
+            return
+        b, position = self._localiser(indice)
+        self._bloc_propre(b)[position] = valeur
+
+    def __delitem__(self, indice) -> None:
+        if isinstance(indice, slice):
+            for i in sorted(range(*indice.indices(len(self))), reverse=True):
+                del self[i]
+            return
+        b, position = self._localiser(indice)
+        bloc = self._bloc_propre(b)
+        del bloc[position]
+        if not bloc:
+            del self._blocs[b], self._propres[b], self._fins[b]
+        for k in range(b, len(self._fins)):
+            self._fins[k] -= 1
+
+    def insert(self, indice: int, valeur) -> None:
+        if indice < 0:
+            indice = max(0, indice + len(self))
+        if indice >= len(self):
+            self.append(valeur)
+            return
+        b, position = self._localiser(indice)
+        bloc = self._bloc_propre(b)
+        bloc.insert(position, valeur)
+        for k in range(b, len(self._fins)):
+            self._fins[k] += 1
+        if len(bloc) > 2 * self.TAILLE_BLOC:
+            # Scinder le bloc trop grand en deux moitiés
+            moitie = bloc[len(bloc) // 2:]
+            del bloc[len(bloc) // 2:]
+            self._blocs.insert(b + 1, moitie)
+            self._propres.insert(b + 1, True)
+            self._fins.insert(b, self._fins[b] - len(moitie))
+
+    def append(self, valeur) -> None:
+        if not self._blocs or len(self._blocs[-1]) >= self.TAILLE_BLOC:
+            self._ajouter_bloc(self._nouveau_bloc((valeur,)), True)
+        else:
+            self._bloc_propre(-1).append(valeur)
+            self._fins[-1] += 1
+
+    def __iter__(self) -> Iterator:
+        for bloc in self._blocs:
+            yield from bloc
+
+    def index(self, valeur, debut: int = 0, fin: Optional[int] = None) -> int:
+        for i, element in enumerate(self):
+            if fin is not None and i >= fin:
+                break
+            if i >= debut and (element is valeur or element == valeur):
+                return i
+        raise ValueError(f"{valeur!r} absent de la séquence.")
+
+    def clear(self) -> None:
+        self._blocs, self._propres, self._fins = [], [], []
+
+    def filtrer_masque(self, masque: bytearray) -> None:
+        """Conserve les éléments dont l'octet de masque est non nul ; les blocs intacts restent partagés."""
+        blocs, propres, debut = self._blocs, self._propres, 0
+        self.clear()
+        for bloc, propre in zip(blocs, propres):
+            garde = masque[debut:debut + len(bloc)]
+            debut += len(bloc)
+            if not all(garde):
+                bloc, propre = self._nouveau_bloc(e for e, g in zip(bloc, garde) if g), True
+            if bloc:
+                self._ajouter_bloc(bloc, propre)
+
+    def filtrer(self, garder: Callable) -> None:
+        """Conserve les éléments pour lesquels garder(e) est vrai."""
+        self.filtrer_masque(bytearray(1 if garder(e) else 0 for e in self))
+
+    def __eq__(self, autre) -> bool:
+        if isinstance(autre, (list, ListeBlocs)):
+            return len(self) == len(autre) and all(a is b or a == b for a, b in zip(self, autre))
+        return NotImplemented
+
+    def __add__(self, autre) -> list:
+        return list(self) + list(autre)
+
+    def __radd__(self, autre) -> list:
+        return list(autre) + list(self)
+
+    def __repr__(self) -> str:
+        return f"ListeBlocs({list(self)!r})"
+
+class TransitionsColonnaires(MutableSequence):
+    """
+    Stockage colonnaire des transitions d'un automate.
+
+    Chaque transition est une ligne de trois tableaux d'entiers parallèles
+    (source, destination, symbole) indexant des registres d'états et de symboles.
+    Les identifiants de la forme "trans_<n>" sont stockés sous forme de l'entier n ;
+    les autres sont conservés à part. L'accès par indice ou par itération renvoie
+    des vues exposant l'API habituelle de Transition.
+    Les registres comptent les lignes qui référencent chaque entrée : une entrée qui
+    n'est plus référencée est libérée (et sa case réutilisée), si bien que les états
+    et symboles supprimés ne restent pas retenus par le stockage.
+    Après copie(), les colonnes sont des ListeBlocs partagés bloc par bloc, et les
+    registres ne sont copiés qu'à leur première modification.
+    """
+
+    _PREFIXE_ID = "trans_"
+
+    def __init__(self, transitions: Optional[List[Transition]] = None):
+        self._source = array("i")
+        self._dest = array("i")
+        self._symbole = array("i")
+        self._numero = array("i")  # n pour "trans_<n>", -(k+1) pour _idsLibres[k]
+        self._idsLibres: List[Optional[str]] = []
+        self._etats: List[Optional[Etat]] = []
+        self._indexEtats: Dict[int, int] = {}
+        self._refsEtats: List[int] = []
+        self._casesEtats: List[int] = []  # cases libérées de _etats, réutilisables
+        self._alphabets: List[Optional[Alphabet]] = []
+        self._indexAlphabets: Dict[int, int] = {}
+        self._refsAlphabets: List[int] = []
+        self._casesAlphabets: List[int] = []
+        self._registresPropres = True  # False tant que les registres sont partagés avec une copie
+        for transition in transitions or []:
+            self.append(transition)
+
+    # --- Encodage des colonnes ---
+    @staticmethod
+    def _acquerir(objet, registre: List, index: Dict[int, int], refs: List[int], cases: List[int]) -> int:
+        """Renvoie l'indice de objet dans le registre (en l'y ajoutant) et compte une référence de plus."""
+        indice = index.get(id(objet))
+        if indice is None:
+            if cases:
+                indice = cases.pop()
+                registre[indice] = objet
+            else:
+                indice = len(registre)
+                registre.append(objet)
+                refs.append(0)
+            index[id(objet)] = indice
+        refs[indice] += 1
+        return indice
+
+    @staticmethod
+    def _relacher(indice: int, registre: List, index: Dict[int, int], refs: List[int], cases: List[int]) -> None:
+        """Compte une référence de moins ; libère l'entrée quand plus aucune ligne ne la référence."""
+        refs[indice] -= 1
+        if refs[indice] == 0:
+            del index[id(registre[indice])]
+            registre[indice] = None
+            cases.append(indice)
+
+    _REGISTRES = ("_idsLibres", "_etats", "_indexEtats", "_refsEtats", "_casesEtats",
+                  "_alphabets", "_indexAlphabets", "_refsAlphabets", "_casesAlphabets")
+
+    def _posseder_registres(self) -> None:
+        """Copie les registres partagés avec une autre version avant de les modifier."""
+        if not self._registresPropres:
+            for nom in self._REGISTRES:
+                setattr(self, nom, getattr(self, nom).copy())
+            self._registresPropres = True
+
+    def _indice_etat(self, etat: Etat) -> int:
+        self._posseder_registres()
+        return self._acquerir(etat, self._etats, self._indexEtats, self._refsEtats, self._casesEtats)
+
+    def _indice_alphabet(self, alphabet: Alphabet) -> int:
+        self._posseder_registres()
+        return self._acquerir(alphabet, self._alphabets, self._indexAlphabets, self._refsAlphabets, self._casesAlphabets)
+
+    def _liberer_etat(self, indice: int) -> None:
+        self._posseder_registres()
+        self._relacher(indice, self._etats, self._indexEtats, self._refsEtats, self._casesEtats)
+
+    def _liberer_alphabet(self, indice: int) -> None:
+        self._posseder_registres()
+        self._relacher(indice, self._alphabets, self._indexAlphabets, self._refsAlphabets, self._casesAlphabets)
+
+    def _liberer_id(self, numero: int) -> None:
+        if numero < 0:
+            self._posseder_registres()
+            self._idsLibres[-numero - 1] = None
+
+    def _liberer_ligne(self, ligne: int) -> None:
+        """Relâche les entrées de registre référencées par une ligne avant sa suppression."""
+        self._liberer_etat(self._source[ligne])
+        self._liberer_etat(self._dest[ligne])
+        self._liberer_alphabet(self._symbole[ligne])
+        self._liberer_id(self._numero[ligne])
+
+    def _encoder_id(self, idTransition: str) -> int:
+        suffixe = idTransition[len(self._PREFIXE_ID):]
+        if (idTransition.startswith(self._PREFIXE_ID) and suffixe.isdecimal()
+                and str(int(suffixe)) == suffixe and int(suffixe) < 2**31):
+            return int(suffixe)
+        self._posseder_registres()
+        self._idsLibres.append(idTransition)
+        return -len(self._idsLibres)
+
+    def _decoder_id(self, numero: int) -> str:
+        if numero >= 0:
+            return f"{self._PREFIXE_ID}{numero}"
+        return self._idsLibres[-numero - 1]
+
+    def _ligne(self, indice: int) -> int:
+        if indice < 0:
+            indice += len(self._source)
+        if not 0 <= indice < len(self._source):
+            raise IndexError("Indice de transition hors limites.")
+        return indice
+
+    # --- Protocole MutableSequence ---
+    def __len__(self) -> int:
+        return len(self._source)
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [_TransitionVue(self, i) for i in range(*indice.indices(len(self)))]
+        return _TransitionVue(self, self._ligne(indice))
+
+    def __setitem__(self, indice: int, transition: Transition) -> None:
+        ligne = self._ligne(indice)
+        # Acquérir les nouvelles entrées avant de relâcher les anciennes (elles peuvent coïncider)
+        source = self._indice_etat(transition.etatSource)
+        dest = self._indice_etat(transition.etatDestination)
+        symbole = self._indice_alphabet(transition.alphabet)
+        numero = self._encoder_id(transition.idTransition)
+        self._liberer_ligne(ligne)
+        self._source[ligne] = source
+        self._dest[ligne] = dest
+        self._symbole[ligne] = symbole
+        self._numero[ligne] = numero
+
+    def __delitem__(self, indice) -> None:
+        if isinstance(indice, slice):
+            for ligne in range(*indice.indices(len(self))):
+                self._liberer_ligne(ligne)
+        else:
+            indice = self._ligne(indice)
+            self._liberer_ligne(indice)
+        for colonne in (self._source, self._dest, self._symbole, self._numero):
+            del colonne[indice]
+
+    def __iter__(self) -> Iterator[Transition]:
+        for ligne in range(len(self._source)):
+            yield _TransitionVue(self, ligne)
+
+    def insert(self, indice: int, transition: Transition) -> None:
+        self._source.insert(indice, self._indice_etat(transition.etatSource))
+        self._dest.insert(indice, self._indice_etat(transition.etatDestination))
+        self._symbole.insert(indice, self._indice_alphabet(transition.alphabet))
+        self._numero.insert(indice, self._encoder_id(transition.idTransition))
+
+    def append(self, transition: Transition) -> None:
+        self._source.append(self._indice_etat(transition.etatSource))
+        self._dest.append(self._indice_etat(transition.etatDestination))
+        self._symbole.append(self._indice_alphabet(transition.alphabet))
+        self._numero.append(self._encoder_id(transition.idTransition))
+
+    def remove(self, transition: Transition) -> None:
+        """Supprime la première transition portant le même identifiant."""
+        for ligne, numero in enumerate(self._numero):
+            if self._decoder_id(numero) == transition.idTransition:
+                del self[ligne]
+                return
+        raise ValueError(f"Transition avec l'id {transition.idTransition} introuvable.")
+
+    def copie(self) -> 'TransitionsColonnaires':
+        """
+        Nouvelle version du stockage : les colonnes (converties en ListeBlocs) et les
+        registres sont partagés et chaque version ne copie que ce qu'elle modifie.
+        """
+        copie = TransitionsColonnaires.__new__(TransitionsColonnaires)
+        for nom in ("_source", "_dest", "_symbole", "_numero"):
+            colonne = getattr(self, nom)
+            if not isinstance(colonne, ListeBlocs):
+                colonne = ListeBlocs(colonne, "i")
+                setattr(self, nom, colonne)
+            setattr(copie, nom, colonne.copie())
+        for nom in self._REGISTRES:
+            setattr(copie, nom, getattr(self, nom))
+        self._registresPropres = copie._registresPropres = False
+        return copie
+
+    def remplacer_etat(self, ancien: Etat, nouveau: Etat) -> None:
+        """Fait pointer toutes les transitions de ancien vers nouveau, en O(1) via le registre."""
+        self._posseder_registres()
+        indice = self._indexEtats.pop(id(ancien), None)
+        if indice is not None:
+            self._etats[indice] = nouveau
+            self._indexEtats[id(nouveau)] = indice
+
+    def filtrer(self, garder: Callable[[Transition], bool]) -> None:
+        """Conserve en place les seules transitions pour lesquelles garder(t) est vrai."""
+        masque = bytearray(len(self._source))
+        for ligne in range(len(self._source)):
+            if garder(_TransitionVue(self, ligne)):
+                masque[ligne] = 1
+            else:
+                self._liberer_ligne(ligne)
+        for nom in ("_source", "_dest", "_symbole", "_numero"):
+            colonne = getattr(self, nom)
+            if isinstance(colonne, ListeBlocs):
+                colonne.filtrer_masque(masque)  # les blocs intacts restent partagés
+            else:
+                setattr(self, nom, array("i", (v for v, garde in zip(colonne, masque) if garde)))
+
+    def __repr__(self) -> str:
+        return f"TransitionsColonnaires(transitions={len(self)})"
+
 class Automate:
     """Classe principale représentant un automate fini (AFD ou AFN)."""
     
-    def __init__(self, nom: str):
+    def __init__(self, nom: str, compact: bool = False):
         """
         Constructeur de la classe Automate.
         
         Args:
             nom (str): Nom unique de l'automate.
+            compact (bool): Si True, les transitions sont stockées en colonnes d'entiers
+                (voir TransitionsColonnaires) plutôt qu'en liste d'objets Transition.
         """
         self.nom = nom
         self.listAlphabets: List[Alphabet] = []
         self.listEtats: List[Etat] = []
         self.listInitiaux: List[Etat] = []
         self.listFinaux: List[Etat] = []
-        self.listTransition: List[Transition] = []
+        self.listTransition: Union[List[Transition], TransitionsColonnaires] = TransitionsColonnaires() if compact else []
+        self.puitsImplicite: bool = False  # transitions absentes menant à un état puits virtuel
+        self.sequenceJournal: int = 0  # dernier enregistrement du journal intégré à la sauvegarde JSON
+
+    def est_compact(self) -> bool:
+        return isinstance(self.listTransition, TransitionsColonnaires)
+
+    def compacter(self) -> None:
+        """Convertit le stockage des transitions en stockage colonnaire (mémoire réduite)."""
+        if not self.est_compact():
+            self.listTransition = TransitionsColonnaires(self.listTransition)
+
+    def _filtrer_transitions(self, garder: Callable[[Transition], bool]) -> None:
+        """Conserve les transitions pour lesquelles garder(t) est vrai, quel que soit le stockage."""
+        if isinstance(self.listTransition, (TransitionsColonnaires, ListeBlocs)):
+            self.listTransition.filtrer(garder)
+        else:
+            self.listTransition = [t for t in self.listTransition if garder(t)]
+
+    # --- Versions (copie sur écriture) ---
+    CONTENEURS = ("listAlphabets", "listEtats", "listInitiaux", "listFinaux", "listTransition")
+
+    def copie(self, nom: Optional[str] = None) -> 'Automate':
+        """
+        Crée une nouvelle version de l'automate qui partage ses conteneurs par blocs
+        (voir ListeBlocs) : la copie coûte O(n/TAILLE_BLOC), et une modification ultérieure
+        de l'une ou l'autre version ne copie que les blocs qu'elle touche. Les listes
+        simples sont converties en ListeBlocs à la première copie.
+        Les objets Etat, Alphabet et Transition sont partagés et ne doivent pas être modifiés
+        directement ; utiliser modifier_etat pour changer un état.
+        """
+        copie = Automate.__new__(Automate)
+        copie.__dict__.update(self.__dict__)
+        copie.nom = self.nom if nom is None else nom
+        for nom_conteneur in self.CONTENEURS:
+            conteneur = getattr(self, nom_conteneur)
+            if isinstance(conteneur, list):
+                conteneur = ListeBlocs(conteneur)
+                setattr(self, nom_conteneur, conteneur)
+            setattr(copie, nom_conteneur, conteneur.copie())
+        return copie
 
     # --- Méthodes pour gérer les états ---
     def ajouter_etat(self, etat: Etat) -> None:
@@ -147,8 +789,7 @@ class Automate:
             raise ValueError(f"Etat avec l'id {idEtat} introuvable.")
         
         # Supprimer les transitions liées à cet état
-        self.listTransition = [t for t in self.listTransition 
-                             if t.etatSource.idEtat != idEtat and t.etatDestination.idEtat != idEtat]
+        self._filtrer_transitions(lambda t: t.etatSource.idEtat != idEtat and t.etatDestination.idEtat != idEtat)
         
         # Supprimer des listes d'états initiaux/finaux si nécessaire
         if etat in self.listInitiaux:
@@ -158,6 +799,46 @@ class Automate:
         
         self.listEtats.remove(etat)
 
+    def modifier_etat(self, idEtat: str, labelEtat: str, typeEtat: str) -> Etat:
+        """
+        Change le label et le type d'un état sans modifier l'objet Etat, qui peut être partagé
+        avec d'autres versions : il est remplacé par un nouvel objet, à la même place dans
+        listEtats, et les transitions sont redirigées vers lui. Comme au chargement JSON,
+        l'appartenance à listInitiaux/listFinaux découle du nouveau type ; un état qui
+        y entre est placé selon l'ordre de listEtats. Retourne le nouvel état.
+        """
+        ancien = next((e for e in self.listEtats if e.idEtat == idEtat), None)
+        if not ancien:
+            raise ValueError(f"Etat avec l'id {idEtat} introuvable.")
+        nouveau = Etat(idEtat, labelEtat, typeEtat)
+        for i, e in enumerate(self.listEtats):
+            if e is ancien:
+                self.listEtats[i] = nouveau
+        rangs = {id(e): i for i, e in enumerate(self.listEtats)}
+        for nom, typeListe in (("listInitiaux", "initial"), ("listFinaux", "final")):
+            present = any(e is ancien for e in getattr(self, nom))
+            if present and nouveau.typeEtat == typeListe:
+                liste = [nouveau if e is ancien else e for e in getattr(self, nom)]
+            else:
+                liste = [e for e in getattr(self, nom) if e is not ancien]
+            if nouveau.typeEtat == typeListe and not present:
+                rang = rangs[id(nouveau)]
+                position = next((i for i, e in enumerate(liste) if rangs.get(id(e), -1) > rang), len(liste))
+                liste.insert(position, nouveau)
+            setattr(self, nom, liste)
+        if self.est_compact():
+            self.listTransition.remplacer_etat(ancien, nouveau)
+        else:
+            for i, t in enumerate(self.listTransition):
+                if t.etatSource is ancien or t.etatDestination is ancien:
+                    self.listTransition[i] = Transition(
+                        t.idTransition,
+                        nouveau if t.etatSource is ancien else t.etatSource,
+                        nouveau if t.etatDestination is ancien else t.etatDestination,
+                        t.alphabet
+                    )
+        return nouveau
+
     # --- Méthodes pour gérer l'alphabet ---
     def ajouter_alphabet(self, alphabet: Alphabet) -> None:
         """Ajoute un symbole à l'alphabet de l'automate."""
@@ -172,7 +853,7 @@ class Automate:
             raise ValueError(f"Symbole avec l'id {idAlphabet} introuvable.")
         
         # Supprimer les transitions utilisant ce symbole
-        self.listTransition = [t for t in self.listTransition if t.alphabet.idAlphabet != idAlphabet]
+        self._filtrer_transitions(lambda t: t.alphabet.idAlphabet != idAlphabet)
         self.listAlphabets.remove(alphabet)
 
     # --- Méthodes pour gérer les transitions ---
@@ -197,10 +878,16 @@ class Automate:
 
     # --- Méthodes pour la persistance (sauvegarde/chargement) ---
     def sauvegarder_json(self, dossier: str = "Automates") -> None:
-        """Sauvegarde l'automate dans un fichier JSON."""
+        """
+        Sauvegarde l'automate dans un fichier JSON. Le fichier est écrit à côté puis
+        substitué à l'ancien en une opération atomique : une interruption ne laisse
+        jamais de sauvegarde partielle.
+        """
         data = {
             "nom": self.nom,
-            "alphabet": [{"id": a.idAlphabet, "val": a.valAlphabet} for a in self.listAlphabets],
+            "puits_implicite": self.puitsImplicite,
+            "sequence_journal": self.sequenceJournal,
+            "alphabet": [alphabet_vers_json(a) for a in self.listAlphabets],
             "etats": [{"id": e.idEtat, "label": e.labelEtat, "type": e.typeEtat} for e in self.listEtats],
             "transitions": [{
                 "id": t.idTransition,
@@ -212,36 +899,47 @@ class Automate:
         
         os.makedirs(dossier, exist_ok=True)
         chemin = f"{dossier}/{self.nom}.json"
-        with open(chemin, 'w', encoding='utf-8') as f:
+        temporaire = chemin + ".tmp"
+        with open(temporaire, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporaire, chemin)
 
     @classmethod
-    def charger_json(cls, nom: str, dossier: str = "Automates") -> 'Automate':
-        """Charge un automate à partir d'un fichier JSON."""
+    def charger_json(cls, nom: str, dossier: str = "Automates", compact: bool = False, emonder: bool = False) -> 'Automate':
+        """Charge un automate à partir d'un fichier JSON (stockage colonnaire si compact=True, émondé si emonder=True)."""
         chemin = f"{dossier}/{nom}.json"
         with open(chemin, 'r', encoding='utf-8') as f:
             data = json.load(f)
         
-        automate = cls(data["nom"])
+        automate = cls(data["nom"], compact)
+        automate.puitsImplicite = data.get("puits_implicite", False)
+        automate.sequenceJournal = data.get("sequence_journal", 0)
         
         # Charger l'alphabet
         for symbole in data["alphabet"]:
-            automate.ajouter_alphabet(Alphabet(symbole["id"], symbole["val"]))
+            automate.ajouter_alphabet(alphabet_depuis_json(symbole))
         
         # Charger les états
         for etat_data in data["etats"]:
             etat = Etat(etat_data["id"], etat_data["label"], etat_data["type"])
             automate.ajouter_etat(etat)
         
-        # Charger les transitions
+        # Charger les transitions (états et symboles indexés par id : une seule passe)
+        etats = {e.idEtat: e for e in automate.listEtats}
+        symboles = {a.idAlphabet: a for a in automate.listAlphabets}
         for transition_data in data["transitions"]:
-            source = next(e for e in automate.listEtats if e.idEtat == transition_data["source"])
-            dest = next(e for e in automate.listEtats if e.idEtat == transition_data["dest"])
-            symbole = next(a for a in automate.listAlphabets if a.idAlphabet == transition_data["symbole"])
-            automate.ajouter_transition(Transition(
-                transition_data["id"], source, dest, symbole
+            automate.listTransition.append(Transition(
+                transition_data["id"],
+                etats[transition_data["source"]],
+                etats[transition_data["dest"]],
+                symboles[transition_data["symbole"]]
             ))
         
+        if emonder:
+            from Analyse import AnalyseAutomate
+            AnalyseAutomate.emonder(automate)
         return automate
 
     def __repr__(self) -> str:
@@ -0,0 +1,197 @@
+from array import array
+from typing import Dict, Iterable, List, Optional, Union
+
+from model import Automate
+from symboles import PartitionAlphabet
+
+
+def numeroter_etats(automate: Automate) -> Dict[str, int]:
+    """
+    Numérote les états selon listEtats, puis ceux qui n'apparaissent que dans des
+    transitions ; sert d'indices de lignes aux tables et matrices compilées.
+    """
+    indices: Dict[str, int] = {}
+    for e in automate.listEtats:
+        indices.setdefault(e.idEtat, len(indices))
+    for t in automate.listTransition:
+        indices.setdefault(t.etatSource.idEtat, len(indices))
+        indices.setdefault(t.etatDestination.idEtat, len(indices))
+    return indices
+
+
+class AutomateCompile:
+    """
+    Table de transitions compilée d'un automate (supposé déterministe).
+
+    Les états sont numérotés selon listEtats et les colonnes de la table sont les
+    classes d'équivalence de PartitionAlphabet : chaque caractère lu est converti en
+    classe par une table directe (octets) ou une recherche dichotomique, puis l'état
+    suivant est lu dans un tableau plat d'entiers. Comme simuler_mot, c'est la première
+    transition de listTransition qui est retenue pour chaque couple (état, classe).
+
+    Les entrées absentes valent PUITS (-1) : elles désignent l'état puits, virtuel pour
+    un automate complété implicitement (voir AnalyseAutomate.completer), et la lecture
+    s'arrête dès qu'il est atteint puisqu'il est non final et absorbant.
+    """
+
+    PUITS = -1
+
+    def __init__(self, automate: Automate):
+        if not automate.listInitiaux:
+            raise ValueError("Aucun état initial défini.")
+        self.partition = PartitionAlphabet(automate.listAlphabets)
+        self.indices = numeroter_etats(automate)
+        self.nb_etats = len(self.indices)
+        self.nb_classes = self.partition.nb_classes
+        self.initial = self.indices[automate.listInitiaux[0].idEtat]
+        self.finaux = bytearray(self.nb_etats)
+        for e in automate.listFinaux:
+            self.finaux[self.indices[e.idEtat]] = 1
+
+        # Colonnes couvertes par chaque valeur de symbole
+        classes_par_val = self.partition.classes_par_valeur()
+        self.table = array("l", [self.PUITS]) * (self.nb_etats * self.nb_classes)
+        for t in automate.listTransition:
+            ligne = self.indices[t.etatSource.idEtat] * self.nb_classes
+            dest = self.indices[t.etatDestination.idEtat]
+            for classe in classes_par_val.get(t.alphabet.valAlphabet, ()):
+                if self.table[ligne + classe] == self.PUITS:
+                    self.table[ligne + classe] = dest
+
+    def transiter(self, etat: int, caractere: Union[str, int]) -> int:
+        """Renvoie l'état atteint depuis etat en lisant caractere, PUITS s'il n'y en a pas."""
+        classe = self.partition.classe_de(caractere)
+        if classe < 0 or etat == self.PUITS:
+            return self.PUITS
+        return self.table[etat * self.nb_classes + classe]
+
+    def accepte(self, mot: Iterable[Union[str, int]]) -> bool:
+        """Indique si le mot (chaîne ou octets) est reconnu."""
+        table, nb_classes = self.table, self.nb_classes
+        classes, classe_de = self.partition.table, self.partition.classe_de
+        taille = len(classes)
+        etat = self.initial
+        for caractere in mot:
+            code = caractere if isinstance(caractere, int) else ord(caractere)
+            classe = classes[code] if code < taille else classe_de(code)
+            if classe < 0:
+                return False
+            etat = table[etat * nb_classes + classe]
+            if etat == self.PUITS:
+                return False
+        return bool(self.finaux[etat])
+
+    def __repr__(self) -> str:
+        return f"AutomateCompile(états={self.nb_etats}, classes={self.nb_classes})"
+
+
+class AutomateBitParallele:
+    """
+    Simulation bit-parallèle d'un AFN : l'ensemble des états actifs est un entier
+    dont le bit i représente l'état i (numérotation de listEtats).
+
+    Pour chaque classe de symboles (voir PartitionAlphabet), chaque état a un masque
+    de successeurs. Jusqu'à MAX_ETATS_TABLES états, le successeur d'un ensemble est
+    précalculé par tranches de 8 bits : avancer coûte un accès de table et un OU par
+    tranche non vide. Les tables d'une classe (256 entiers de n bits par tranche,
+    soit O(n²) bits) sont construites à sa première lecture. Au-delà, on fait le OU
+    des masques des seuls états actifs, sans table.
+
+    Compiler une fois puis appeler accepte pour chaque mot ; simuler_mot_afn accepte
+    aussi une instance déjà compilée.
+    """
+
+    LARGEUR_TRANCHE = 8
+    MAX_ETATS_TABLES = 64
+
+    def __init__(self, automate: Automate):
+        self.partition = PartitionAlphabet(automate.listAlphabets)
+        self.indices = numeroter_etats(automate)
+        self.nb_etats = len(self.indices)
+        self.nb_classes = self.partition.nb_classes
+        self.initiaux = 0
+        for e in automate.listInitiaux:
+            self.initiaux |= 1 << self.indices[e.idEtat]
+        self.finaux = 0
+        for e in automate.listFinaux:
+            self.finaux |= 1 << self.indices[e.idEtat]
+
+        # Masque des successeurs de chaque état, par classe
+        classes_par_val = self.partition.classes_par_valeur()
+        self.successeurs: List[List[int]] = [[0] * self.nb_etats for _ in range(self.nb_classes)]
+        for t in automate.listTransition:
+            src = self.indices[t.etatSource.idEtat]
+            bit = 1 << self.indices[t.etatDestination.idEtat]
+            for classe in classes_par_val.get(t.alphabet.valAlphabet, ()):
+                self.successeurs[classe][src] |= bit
+
+        self.nb_tranches = max(1, -(-self.nb_etats // self.LARGEUR_TRANCHE))
+        # None : trop d'états pour les tables, on avance par les masques
+        self.tables: Optional[List[Optional[List[List[int]]]]] = (
+            [None] * self.nb_classes if self.nb_etats <= self.MAX_ETATS_TABLES else None
+        )
+
+    def _table_tranche(self, masques: List[int], decalage: int) -> List[int]:
+        """Successeurs de chacun des 256 sous-ensembles des états decalage..decalage+7."""
+        table = [0] * (1 << self.LARGEUR_TRANCHE)
+        for sous_ensemble in range(1, len(table)):
+            bas = sous_ensemble & -sous_ensemble
+            i = decalage + bas.bit_length() - 1
+            table[sous_ensemble] = table[sous_ensemble ^ bas] | (masques[i] if i < len(masques) else 0)
+        return table
+
+    def avancer(self, actifs: int, caractere: Union[str, int]) -> int:
+        """Renvoie l'ensemble des états atteints depuis actifs en lisant caractere."""
+        classe = self.partition.classe_de(caractere)
+        if classe < 0:
+            return 0
+        return self._avancer_classe(actifs, classe)
+
+    def _tables_classe(self, classe: int) -> List[List[int]]:
+        tables = self.tables[classe]
+        if tables is None:
+            masques = self.successeurs[classe]
+            tables = [self._table_tranche(masques, k * self.LARGEUR_TRANCHE) for k in range(self.nb_tranches)]
+            self.tables[classe] = tables
+        return tables
+
+    def _avancer_classe(self, actifs: int, classe: int) -> int:
+        if self.tables is None:
+            return self._avancer_masques(actifs, classe)
+        return self._avancer_tables(actifs, classe)
+
+    def _avancer_tables(self, actifs: int, classe: int) -> int:
+        suivants = 0
+        tables = self.tables[classe] or self._tables_classe(classe)
+        for table, tranche in zip(tables, actifs.to_bytes(self.nb_tranches, "little")):
+            if tranche:
+                suivants |= table[tranche]
+        return suivants
+
+    def _avancer_masques(self, actifs: int, classe: int) -> int:
+        suivants = 0
+        masques = self.successeurs[classe]
+        while actifs:
+            bas = actifs & -actifs
+            suivants |= masques[bas.bit_length() - 1]
+            actifs ^= bas
+        return suivants
+
+    def accepte(self, mot: Iterable[Union[str, int]]) -> bool:
+        """Indique si le mot (chaîne ou octets) est reconnu par l'AFN."""
+        classes, classe_de = self.partition.table, self.partition.classe_de
+        taille = len(classes)
+        avancer = self._avancer_masques if self.tables is None else self._avancer_tables
+        actifs = self.initiaux
+        for caractere in mot:
+            code = caractere if isinstance(caractere, int) else ord(caractere)
+            classe = classes[code] if code < taille else classe_de(code)
+            if classe < 0:
+                return False
+            actifs = avancer(actifs, classe)
+            if not actifs:
+                return False
+        return bool(actifs & self.finaux)
+
+    def __repr__(self) -> str:
+        return f"AutomateBitParallele(états={self.nb_etats}, classes={self.nb_classes}, tranches={self.nb_tranches})"
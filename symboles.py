@@ -0,0 +1,123 @@
+from array import array
+from bisect import bisect_right
+from typing import Dict, List, Tuple, Union
+
+from model import Alphabet, ClasseSymboles
+
+
+class PartitionAlphabet:
+    """
+    Partition des caractères en classes d'équivalence vis-à-vis d'un alphabet.
+
+    Deux caractères sont équivalents s'ils appartiennent exactement aux mêmes symboles
+    (caractères littéraux ou ClasseSymboles) de l'alphabet : aucun automate sur cet
+    alphabet ne peut les distinguer. Les tables de transitions peuvent donc être
+    indexées par classe plutôt que par caractère.
+
+    Les symboles littéraux de longueur différente de 1 (ex: '' ou 'ab') ne sont pas
+    des caractères : chacun forme sa propre classe, accessible via classe_de_symbole.
+    """
+
+    TAILLE_TABLE = 256  # points de code couverts par la table de correspondance directe
+
+    def __init__(self, alphabets: List[Alphabet]):
+        self.alphabets = list(alphabets)
+        intervalles_par_symbole: List[List[Tuple[int, int]]] = []
+        opaques: Dict[str, List[int]] = {}
+        for i, a in enumerate(self.alphabets):
+            if isinstance(a, ClasseSymboles):
+                intervalles_par_symbole.append(a.intervalles)
+            elif len(a.valAlphabet) == 1:
+                code = ord(a.valAlphabet)
+                intervalles_par_symbole.append([(code, code)])
+            else:
+                intervalles_par_symbole.append([])
+                opaques.setdefault(a.valAlphabet, []).append(i)
+
+        # 1. Segments élémentaires délimités par les bornes de tous les intervalles
+        bornes = sorted({b for intervalles in intervalles_par_symbole
+                         for debut, fin in intervalles for b in (debut, fin + 1)})
+        couverture: List[List[int]] = [[] for _ in bornes]
+        for i, intervalles in enumerate(intervalles_par_symbole):
+            for debut, fin in intervalles:
+                for k in range(bisect_right(bornes, debut) - 1, bisect_right(bornes, fin)):
+                    couverture[k].append(i)
+
+        # 2. Regroupement des segments de même signature en classes
+        classe_par_signature: Dict[Tuple[int, ...], int] = {}
+        self.intervalles_classes: List[List[Tuple[int, int]]] = []
+        self._debuts = array("l")
+        self._classes_segments = array("l")
+        for k, debut in enumerate(bornes):
+            signature = tuple(couverture[k])
+            if signature:
+                classe = classe_par_signature.get(signature)
+                if classe is None:
+                    classe = len(self.intervalles_classes)
+                    classe_par_signature[signature] = classe
+                    self.intervalles_classes.append([])
+                self.intervalles_classes[classe].append((debut, bornes[k + 1] - 1))
+            else:
+                classe = -1
+            self._debuts.append(debut)
+            self._classes_segments.append(classe)
+        self.nb_classes_caracteres = len(self.intervalles_classes)
+
+        # 3. Classes propres aux symboles non caractères
+        self._classes_opaques: Dict[str, int] = {}
+        for val, indices in opaques.items():
+            self._classes_opaques[val] = len(self.intervalles_classes)
+            self.intervalles_classes.append([])
+            classe_par_signature[tuple(indices)] = self._classes_opaques[val]
+        self.nb_classes = len(self.intervalles_classes)
+
+        # 4. Classes couvertes par chaque symbole de l'alphabet
+        self.classes_symbole: List[List[int]] = [[] for _ in self.alphabets]
+        for signature, classe in classe_par_signature.items():
+            for i in signature:
+                self.classes_symbole[i].append(classe)
+        for classes in self.classes_symbole:
+            classes.sort()
+
+        # 5. Table de correspondance directe octet -> classe
+        self.table = array("l", (self._chercher(code) for code in range(self.TAILLE_TABLE)))
+
+    def _chercher(self, code: int) -> int:
+        k = bisect_right(self._debuts, code) - 1
+        return self._classes_segments[k] if k >= 0 else -1
+
+    def classe_de(self, caractere: Union[str, int]) -> int:
+        """Renvoie la classe d'un caractère (ou d'un octet), -1 s'il n'appartient à aucun symbole."""
+        code = caractere if isinstance(caractere, int) else ord(caractere)
+        if code < self.TAILLE_TABLE:
+            return self.table[code]
+        return self._chercher(code)
+
+    def classes_par_valeur(self) -> Dict[str, List[int]]:
+        """Renvoie, pour chaque valeur de symbole de l'alphabet, la liste des classes qu'il couvre."""
+        return {a.valAlphabet: self.classes_symbole[i] for i, a in enumerate(self.alphabets)}
+
+    def classe_de_symbole(self, valAlphabet: str) -> int:
+        """Renvoie la classe d'un symbole non caractère (ex: ''), -1 s'il est inconnu."""
+        if len(valAlphabet) == 1:
+            return self.classe_de(valAlphabet)
+        return self._classes_opaques.get(valAlphabet, -1)
+
+    def representant(self, classe: int) -> str:
+        """Renvoie un symbole de la classe : son plus petit caractère, ou la valeur d'un symbole non caractère."""
+        intervalles = self.intervalles_classes[classe]
+        if intervalles:
+            return chr(intervalles[0][0])
+        return next(v for v, c in self._classes_opaques.items() if c == classe)
+
+    def symbole_classe(self, classe: int, idAlphabet: str) -> Alphabet:
+        """Construit le symbole représentant une classe (littéral si elle contient un seul caractère)."""
+        intervalles = self.intervalles_classes[classe]
+        if not intervalles:
+            return Alphabet(idAlphabet, self.representant(classe))
+        if len(intervalles) == 1 and intervalles[0][0] == intervalles[0][1]:
+            return Alphabet(idAlphabet, chr(intervalles[0][0]))
+        return ClasseSymboles(idAlphabet, intervalles)
+
+    def __repr__(self) -> str:
+        return f"PartitionAlphabet(symboles={len(self.alphabets)}, classes={self.nb_classes})"